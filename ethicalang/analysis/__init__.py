@@ -1,7 +1,24 @@
 """Static analysis modules for EthicaLang"""
-from .energy import EnergyAnalyzer
-from .ethics import EthicsChecker
-from .readability import ReadabilityScorer
-from .cleverness import ClevernessDetector
+import importlib
 
-__all__ = ['EnergyAnalyzer', 'EthicsChecker', 'ReadabilityScorer', 'ClevernessDetector']
+# Analyzers are imported on first use, so that a caller needing only some
+# of them (e.g. the CLI with checks disabled) doesn't load the others
+_ANALYZER_MODULES = {
+    'EnergyAnalyzer': '.energy',
+    'EthicsChecker': '.ethics',
+    'ReadabilityScorer': '.readability',
+    'ClevernessDetector': '.cleverness',
+    'CombinedAnalyzer': '.combined',
+}
+
+__all__ = ['EnergyAnalyzer', 'EthicsChecker', 'ReadabilityScorer', 'ClevernessDetector',
+           'CombinedAnalyzer']
+
+
+def __getattr__(name):
+    if name in _ANALYZER_MODULES:
+        module = importlib.import_module(_ANALYZER_MODULES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,10 +12,38 @@ Detection Patterns:
 - Cryptic one-liners
 """
 
-from typing import Dict, List
+from typing import Dict, List, Set
 from ..ast.nodes import *
 
 
+# Numbers common enough not to count as magic
+_COMMON_NUMBERS = frozenset({100, 1000, 24, 60, 365})
+
+# Operator categories checked on every binary operation
+_COMPARISON_OPS = frozenset({'==', '!=', '<', '<=', '>', '>='})
+_BITWISE_OPS = frozenset({'&', '|', '^', '<<', '>>'})
+
+
+# Report headings for every violation type, so reports don't re-uppercase
+_VIOLATION_HEADINGS = {violation_type: violation_type.upper() for violation_type in (
+    'too_many_parameters',
+    'complex_one_liner',
+    'complex_assignment',
+    'dense_expression',
+    'chained_comparisons',
+    'bitwise_operation',
+    'magic_number',
+    'complex_list_literal',
+    'complex_condition',
+    'complex_loop_condition',
+    'complex_iterable',
+    'complex_return',
+    'too_many_arguments',
+    'excessive_chaining',
+    'excessive_member_chaining',
+)}
+
+
 class ClevernessViolation(Exception):
     """Raised when code is overly clever"""
     pass
@@ -42,6 +70,7 @@ class ClevernessDetector(ASTVisitor):
         Args:
             strict_mode: If True, reject any cleverness violations
         """
+        super().__init__()
         self.strict_mode = strict_mode
         self.violations = []
         self.current_function = None
@@ -49,6 +78,12 @@ class ClevernessDetector(ASTVisitor):
         self.max_expression_depth = 0
         self.chaining_depth = 0
         self.binary_op_count = 0
+        self._depth_cache: Dict[int, int] = {}
+        self._magic_numbers: Set = set()
+        # Violations recorded during the walk, as tuples (see add_violation)
+        self._found: List[tuple] = []
+        # State saved on entering a scope and restored on leaving it
+        self._saved_state: List = []
     
     def analyze(self, ast: Program) -> Dict[str, any]:
         """
@@ -57,13 +92,43 @@ class ClevernessDetector(ASTVisitor):
         Returns:
             Dictionary with analysis results
         """
-        self.violations = []
+        self.prepare(ast)
+        
+        # In strict mode the walk stops at the first violation
+        self.walk(ast)
         
-        try:
-            self.visit(ast)
-        except ClevernessViolation:
-            pass  # Violations are collected
+        return self.results()
+    
+    def prepare(self, ast: Program):
+        """Reset state before walking a program"""
+        self.violations = []
+        self._found = []
+        self._depth_cache = {}
+        self._saved_state = []
+        self.current_function = None
+        self.chaining_depth = 0
+        self.binary_op_count = 0
+        self._aborted = False
+        self._magic_numbers = self._find_magic_numbers(ast)
+    
+    def _find_magic_numbers(self, ast: Program) -> Set:
+        """
+        Classify every numeric literal in one scan of the flattened tree
         
+        Returns the set of values to flag: non-obvious numbers (|n| > 10)
+        that aren't in the common-number whitelist.
+        """
+        magic = set()
+        for _, node, _ in get_events(ast):
+            if node.__class__ is NumericLiteral:
+                value = node.value
+                if isinstance(value, (int, float)) and abs(value) > 10:
+                    magic.add(value)
+        return magic - _COMMON_NUMBERS
+    
+    def results(self) -> Dict[str, any]:
+        """Build the analysis results once the walk is done"""
+        self.violations = [self._as_dict(found) for found in self._found]
         return {
             'passed': len(self.violations) == 0,
             'violations': self.violations,
@@ -72,29 +137,33 @@ class ClevernessDetector(ASTVisitor):
     
     def add_violation(self, violation_type: str, message: str, suggestion: str = None, details: Dict = None):
         """Add a cleverness violation"""
+        if self._aborted:
+            return
+        
+        # Stored as a tuple; results() builds the reported dict
+        self._found.append((violation_type, message, self.current_function, suggestion, details))
+        
+        if self.strict_mode:
+            self._aborted = True
+    
+    @staticmethod
+    def _as_dict(found: tuple) -> Dict:
+        """Build the reported dict for a recorded violation"""
+        violation_type, message, function, suggestion, details = found
         violation = {
             'type': violation_type,
             'message': message,
-            'function': self.current_function
+            'function': function
         }
         if suggestion:
             violation['suggestion'] = suggestion
         if details:
             violation.update(details)
-        
-        self.violations.append(violation)
-        
-        if self.strict_mode:
-            raise ClevernessViolation(message)
+        return violation
     
-    def visit_Program(self, node: Program):
-        """Visit program node"""
-        for stmt in node.statements:
-            self.visit(stmt)
-    
-    def visit_FunctionDef(self, node: FunctionDef):
-        """Visit function definition"""
-        old_function = self.current_function
+    def enter_FunctionDef(self, node: FunctionDef):
+        """Enter function definition"""
+        self._saved_state.append(self.current_function)
         self.current_function = node.name
         
         # Check parameter count
@@ -109,7 +178,7 @@ class ClevernessDetector(ASTVisitor):
         # Check for single-statement functions that might be overly complex
         if len(node.body) == 1 and isinstance(node.body[0], ReturnStatement):
             # Analyze the complexity of the return expression
-            if node.body[0].value:
+            if node.body[0].value is not None:
                 depth = self._get_expression_depth(node.body[0].value)
                 if depth > self.MAX_EXPRESSION_DEPTH:
                     self.add_violation(
@@ -118,17 +187,15 @@ class ClevernessDetector(ASTVisitor):
                         suggestion='Break down the expression into intermediate variables',
                         details={'expression_depth': depth}
                     )
-        
-        # Visit function body
-        for stmt in node.body:
-            self.visit(stmt)
-        
-        self.current_function = old_function
     
-    def visit_Assignment(self, node: Assignment):
-        """Visit assignment"""
+    def exit_FunctionDef(self, node: FunctionDef):
+        """Leave function definition"""
+        self.current_function = self._saved_state.pop()
+    
+    def enter_Assignment(self, node: Assignment):
+        """Enter assignment"""
         # Check expression complexity in assignment
-        old_binary_count = self.binary_op_count
+        self._saved_state.append(self.binary_op_count)
         self.binary_op_count = 0
         
         depth = self._get_expression_depth(node.value)
@@ -139,9 +206,9 @@ class ClevernessDetector(ASTVisitor):
                 suggestion='Break down into multiple statements with intermediate variables',
                 details={'variable': node.name, 'depth': depth}
             )
-        
-        self.visit(node.value)
-        
+    
+    def exit_Assignment(self, node: Assignment):
+        """Leave assignment, once its value has been visited"""
         if self.binary_op_count > self.MAX_BINARY_OPS_PER_STATEMENT:
             self.add_violation(
                 'dense_expression',
@@ -150,19 +217,15 @@ class ClevernessDetector(ASTVisitor):
                 details={'operator_count': self.binary_op_count}
             )
         
-        self.binary_op_count = old_binary_count
+        self.binary_op_count = self._saved_state.pop()
     
-    def visit_Variable(self, node: Variable):
-        """Visit variable reference"""
-        pass
-    
-    def visit_BinaryOp(self, node: BinaryOp):
-        """Visit binary operation"""
+    def enter_BinaryOp(self, node: BinaryOp):
+        """Enter binary operation"""
         self.binary_op_count += 1
         
         # Detect chained comparisons that might be confusing
-        if node.operator in ('==', '!=', '<', '<=', '>', '>='):
-            if isinstance(node.left, BinaryOp) and node.left.operator in ('==', '!=', '<', '<=', '>', '>='):
+        if node.operator in _COMPARISON_OPS:
+            if isinstance(node.left, BinaryOp) and node.left.operator in _COMPARISON_OPS:
                 self.add_violation(
                     'chained_comparisons',
                     'Chained comparison operators can be confusing',
@@ -171,59 +234,43 @@ class ClevernessDetector(ASTVisitor):
                 )
         
         # Detect bitwise operations (often clever)
-        if node.operator in ('&', '|', '^', '<<', '>>'):
+        if node.operator in _BITWISE_OPS:
             self.add_violation(
                 'bitwise_operation',
                 'Bitwise operations can be hard to understand',
                 suggestion='Add comments explaining the bit manipulation or use clearer alternatives',
                 details={'operator': node.operator}
             )
-        
-        self.visit(node.left)
-        self.visit(node.right)
-    
-    def visit_UnaryOp(self, node: UnaryOp):
-        """Visit unary operation"""
-        self.visit(node.operand)
     
-    def visit_Literal(self, node: Literal):
-        """Visit literal value"""
-        # Check for magic numbers (except common ones)
-        if node.type_name in ('int', 'float'):
-            if isinstance(node.value, (int, float)):
-                # Flag non-obvious numbers
-                if abs(node.value) > 10 and node.value not in (100, 1000, 24, 60, 365):
-                    self.add_violation(
-                        'magic_number',
-                        f'Magic number {node.value} used without explanation',
-                        suggestion='Define as a named constant with clear meaning',
-                        details={'value': node.value}
-                    )
+    def enter_NumericLiteral(self, node: NumericLiteral):
+        """Enter numeric literal"""
+        # Magic numbers were classified up front in prepare()
+        if node.value in self._magic_numbers:
+            self.add_violation(
+                'magic_number',
+                f'Magic number {node.value} used without explanation',
+                suggestion='Define as a named constant with clear meaning',
+                details={'value': node.value}
+            )
     
-    def visit_ListLiteral(self, node: ListLiteral):
-        """Visit list literal"""
+    def enter_ListLiteral(self, node: ListLiteral):
+        """Enter list literal"""
         # Check for overly complex list comprehension-like patterns
-        if len(node.elements) > 0:
-            avg_depth = sum(self._get_expression_depth(e) for e in node.elements) / len(node.elements)
-            if avg_depth > 3:
+        count = len(node.elements)
+        if count > 0:
+            total_depth = 0
+            for element in node.elements:
+                total_depth += self._get_expression_depth(element)
+            if total_depth > 3 * count:
                 self.add_violation(
                     'complex_list_literal',
                     'List literal contains complex expressions',
                     suggestion='Create elements in separate statements before building the list',
-                    details={'element_count': len(node.elements)}
+                    details={'element_count': count}
                 )
-        
-        for elem in node.elements:
-            self.visit(elem)
-    
-    def visit_DictLiteral(self, node: DictLiteral):
-        """Visit dictionary literal"""
-        for key, value in node.pairs:
-            self.visit(key)
-            self.visit(value)
     
-    def visit_IfStatement(self, node: IfStatement):
-        """Visit if statement"""
+    def enter_IfStatement(self, node: IfStatement):
+        """Enter if statement"""
         # Check condition complexity
         cond_depth = self._get_expression_depth(node.condition)
         if cond_depth > 3:
@@ -233,16 +280,9 @@ class ClevernessDetector(ASTVisitor):
                 suggestion='Extract condition into a well-named boolean variable',
                 details={'depth': cond_depth}
             )
-        
-        self.visit(node.condition)
-        for stmt in node.then_body:
-            self.visit(stmt)
-        if node.else_body:
-            for stmt in node.else_body:
-                self.visit(stmt)
     
-    def visit_WhileLoop(self, node: WhileLoop):
-        """Visit while loop"""
+    def enter_WhileLoop(self, node: WhileLoop):
+        """Enter while loop"""
         # Check condition complexity
         cond_depth = self._get_expression_depth(node.condition)
         if cond_depth > 3:
@@ -252,13 +292,9 @@ class ClevernessDetector(ASTVisitor):
                 suggestion='Extract condition into a well-named boolean variable or function',
                 details={'depth': cond_depth}
             )
-        
-        self.visit(node.condition)
-        for stmt in node.body:
-            self.visit(stmt)
     
-    def visit_ForLoop(self, node: ForLoop):
-        """Visit for loop"""
+    def enter_ForLoop(self, node: ForLoop):
+        """Enter for loop"""
         # Check iterable complexity
         iter_depth = self._get_expression_depth(node.iterable)
         if iter_depth > 2:
@@ -268,14 +304,10 @@ class ClevernessDetector(ASTVisitor):
                 suggestion='Assign the iterable to a well-named variable first',
                 details={'depth': iter_depth}
             )
-        
-        self.visit(node.iterable)
-        for stmt in node.body:
-            self.visit(stmt)
     
-    def visit_ReturnStatement(self, node: ReturnStatement):
-        """Visit return statement"""
-        if node.value:
+    def enter_ReturnStatement(self, node: ReturnStatement):
+        """Enter return statement"""
+        if node.value is not None:
             # Check return expression complexity
             depth = self._get_expression_depth(node.value)
             if depth > self.MAX_EXPRESSION_DEPTH:
@@ -285,22 +317,20 @@ class ClevernessDetector(ASTVisitor):
                     suggestion='Compute the result in a variable before returning',
                     details={'depth': depth}
                 )
-            self.visit(node.value)
     
-    def visit_FunctionCall(self, node: FunctionCall):
-        """Visit function call"""
+    def enter_FunctionCall(self, node: FunctionCall):
+        """Enter function call"""
         # Check argument count
-        if len(node.arguments) > self.MAX_FUNCTION_ARGS:
-            func_name = node.function.name if isinstance(node.function, Variable) else "function"
+        if node.arg_count > self.MAX_FUNCTION_ARGS:
+            func_name = node.callee_name or "function"
             self.add_violation(
                 'too_many_arguments',
-                f'Call to {func_name} has {len(node.arguments)} arguments (maximum: {self.MAX_FUNCTION_ARGS})',
+                f'Call to {func_name} has {node.arg_count} arguments (maximum: {self.MAX_FUNCTION_ARGS})',
                 suggestion='Consider using named parameters or a parameter object',
-                details={'argument_count': len(node.arguments)}
+                details={'argument_count': node.arg_count}
             )
         
         # Check for nested function calls (chaining)
-        old_chaining = self.chaining_depth
         self.chaining_depth += 1
         
         if self.chaining_depth > self.MAX_CHAINING_DEPTH:
@@ -310,16 +340,13 @@ class ClevernessDetector(ASTVisitor):
                 suggestion='Break the chain into intermediate variables with descriptive names',
                 details={'chaining_depth': self.chaining_depth}
             )
-        
-        self.visit(node.function)
-        for arg in node.arguments:
-            self.visit(arg)
-        
-        self.chaining_depth = old_chaining
     
-    def visit_MemberAccess(self, node: MemberAccess):
-        """Visit member access"""
-        old_chaining = self.chaining_depth
+    def exit_FunctionCall(self, node: FunctionCall):
+        """Leave function call"""
+        self.chaining_depth -= 1
+    
+    def enter_MemberAccess(self, node: MemberAccess):
+        """Enter member access"""
         self.chaining_depth += 1
         
         if self.chaining_depth > self.MAX_CHAINING_DEPTH:
@@ -329,42 +356,44 @@ class ClevernessDetector(ASTVisitor):
                 suggestion='Break the chain using intermediate variables',
                 details={'chaining_depth': self.chaining_depth}
             )
-        
-        self.visit(node.object)
-        self.chaining_depth = old_chaining
     
-    def visit_IndexAccess(self, node: IndexAccess):
-        """Visit index access"""
-        self.visit(node.object)
-        self.visit(node.index)
-    
-    def visit_Annotation(self, node: Annotation):
-        """Visit annotation"""
-        pass
+    def exit_MemberAccess(self, node: MemberAccess):
+        """Leave member access"""
+        self.chaining_depth -= 1
     
     def _get_expression_depth(self, node: ASTNode) -> int:
         """Calculate the depth/complexity of an expression"""
-        if isinstance(node, (Literal, Variable)):
+        # Every statement re-queries its subexpressions, so depths are
+        # memoized per node to keep the whole analysis linear
+        key = id(node)
+        depth = self._depth_cache.get(key)
+        if depth is None:
+            depth = self._compute_expression_depth(node)
+            self._depth_cache[key] = depth
+        return depth
+    
+    def _compute_expression_depth(self, node: ASTNode) -> int:
+        """Compute expression depth, reusing cached depths of children"""
+        kind = node._depth_kind
+        if kind == DEPTH_LEAF:
             return 1
-        elif isinstance(node, BinaryOp):
+        elif kind == DEPTH_BINARY:
             return 1 + max(
                 self._get_expression_depth(node.left),
                 self._get_expression_depth(node.right)
             )
-        elif isinstance(node, UnaryOp):
+        elif kind == DEPTH_UNARY:
             return 1 + self._get_expression_depth(node.operand)
-        elif isinstance(node, FunctionCall):
+        elif kind == DEPTH_CALL:
             arg_depth = max(
                 (self._get_expression_depth(arg) for arg in node.arguments),
                 default=0
             )
             return 2 + arg_depth
-        elif isinstance(node, (MemberAccess, IndexAccess)):
+        elif kind == DEPTH_ACCESS:
             return 1 + self._get_expression_depth(node.object)
-        elif isinstance(node, (ListLiteral, DictLiteral)):
-            return 2
         else:
-            return 1
+            return 2
 
 
 def format_cleverness_report(results: Dict) -> str:
@@ -381,13 +410,17 @@ def format_cleverness_report(results: Dict) -> str:
         return "✓ Cleverness check passed: Code is appropriately clear"
     
     report = ["❌ Cleverness check failed: Code is overly clever\n"]
+    append = report.append
     for i, violation in enumerate(results['violations'], 1):
-        report.append(f"{i}. {violation['type'].upper()}")
-        report.append(f"   {violation['message']}")
-        if violation.get('suggestion'):
-            report.append(f"   💡 Suggestion: {violation['suggestion']}")
-        if violation.get('function'):
-            report.append(f"   Function: {violation['function']}")
-        report.append("")
+        violation_type = violation['type']
+        heading = _VIOLATION_HEADINGS.get(violation_type) or violation_type.upper()
+        append(f"{i}. {heading}\n   {violation['message']}")
+        suggestion = violation.get('suggestion')
+        if suggestion:
+            append(f"   💡 Suggestion: {suggestion}")
+        function = violation.get('function')
+        if function:
+            append(f"   Function: {function}")
+        append("")
     
     return "\n".join(report)
@@ -0,0 +1,144 @@
+"""
+Combined Analyzer for EthicaLang
+
+Runs several hook-based analyzers over the AST in a single traversal.
+Each node is visited once and handed to every analyzer that has a hook
+for its type, instead of walking the whole tree once per analyzer.
+
+Analyzers taking part must implement the walk() protocol:
+- prepare(ast): reset state before the walk
+- enter_X/exit_X (and optionally enter_block/exit_block) hooks
+- results(): build the result dictionary after the walk
+
+An exception raised by one analyzer (in prepare, a hook or results) is
+recorded in errors under that analyzer's name; the others carry on.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..ast.nodes import *
+
+
+class CombinedAnalyzer(ASTVisitor):
+    """
+    Fans a single AST walk out to several analyzers
+    
+    An analyzer that aborts (e.g. the energy budget is exhausted, or a
+    strict-mode violation is found) or raises stops receiving hooks; the
+    walk only stops once every analyzer has aborted.
+    """
+    
+    def __init__(self, analyzers: Dict[str, ASTVisitor]):
+        """
+        Initialize the combined analyzer
+        
+        Args:
+            analyzers: Mapping of result name -> analyzer instance
+        """
+        super().__init__()
+        self.analyzers = dict(analyzers)
+        # Result name -> exception, for analyzers that raised during analyze()
+        self.errors: Dict[str, Exception] = {}
+        self._names = {id(analyzer): name for name, analyzer in self.analyzers.items()}
+        # Hooks depend on which analyzers this instance combines, so the
+        # dispatch table is per instance rather than shared by the class
+        self._hook_table = {}
+        self._block_hooks = (self._fan_out('enter_block'), self._fan_out('exit_block'))
+    
+    def analyze(self, ast: Program) -> Dict[str, Dict[str, Any]]:
+        """
+        Run every analyzer over the program in one pass
+        
+        Returns:
+            Dictionary mapping each analyzer's name to its results; an
+            analyzer that raised has no entry, its exception is in errors
+        """
+        self.errors = {}
+        for name, analyzer in self.analyzers.items():
+            try:
+                analyzer.prepare(ast)
+            except Exception as e:
+                self.errors[name] = e
+                analyzer._aborted = True
+        self._update_aborted()
+        
+        self.walk(ast)
+        
+        results = {}
+        for name, analyzer in self.analyzers.items():
+            if name in self.errors:
+                continue
+            try:
+                results[name] = analyzer.results()
+            except Exception as e:
+                self.errors[name] = e
+        return results
+    
+    def _compile_walk(self, root: ASTNode) -> List[tuple]:
+        """Resolve the traversal for this instance; fan-outs aren't cacheable"""
+        return self._resolve_calls(root)
+    
+    def _block_hook_functions(self) -> tuple:
+        """Return the fan-out enter_block/exit_block hooks"""
+        return self._block_hooks
+    
+    def _resolve_hooks(self, cls: type) -> tuple:
+        """Build the fan-out enter/exit hooks for a node class"""
+        hooks = []
+        for hook_names in (cls._enter_names, cls._exit_names):
+            targets = self._targets(hook_names)
+            if not targets:
+                hooks.append(None)
+                continue
+            
+            # walk() passes the visitor first; the analyzers' hooks are bound
+            def hook(_visitor, node, targets=targets):
+                for target, analyzer in targets:
+                    if not analyzer._aborted:
+                        try:
+                            target(node)
+                        except Exception as e:
+                            self._fail(analyzer, e)
+                        if analyzer._aborted:
+                            self._update_aborted()
+            
+            hooks.append(hook)
+        
+        hooks = tuple(hooks)
+        self._hook_table[cls] = hooks
+        return hooks
+    
+    def _fan_out(self, hook_name: str) -> Optional[Callable]:
+        """Build a block hook calling hook_name on every analyzer defining it"""
+        targets = self._targets((hook_name,))
+        if not targets:
+            return None
+        
+        def hook(_visitor, node, field_name):
+            for target, analyzer in targets:
+                if not analyzer._aborted:
+                    try:
+                        target(node, field_name)
+                    except Exception as e:
+                        self._fail(analyzer, e)
+                    if analyzer._aborted:
+                        self._update_aborted()
+        
+        return hook
+    
+    def _targets(self, hook_names: tuple) -> List[Tuple[Callable, ASTVisitor]]:
+        """Collect (bound hook, analyzer) for every analyzer defining one of hook_names"""
+        targets = []
+        for analyzer in self.analyzers.values():
+            hook = self._find_method(analyzer, hook_names)
+            if hook is not None:
+                targets.append((hook, analyzer))
+        return targets
+    
+    def _fail(self, analyzer: ASTVisitor, error: Exception):
+        """Record an analyzer's exception and stop handing it hooks"""
+        self.errors[self._names[id(analyzer)]] = error
+        analyzer._aborted = True
+    
+    def _update_aborted(self):
+        """Stop the walk once every analyzer has aborted"""
+        self._aborted = all(analyzer._aborted for analyzer in self.analyzers.values())
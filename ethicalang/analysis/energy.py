@@ -11,15 +11,70 @@ Cost Model:
 - Nested structures increase costs exponentially
 """
 
-from typing import Dict, Set
+from typing import Dict, List, Optional, Set
 from ..ast.nodes import *
 
 
+# Base costs for operations (in energy units)
+_COST_LITERAL = 1
+_COST_VARIABLE = 1
+_COST_ASSIGNMENT = 2
+_COST_BINARY_OP = 3
+_COST_UNARY_OP = 2
+_COST_FUNCTION_CALL = 10
+_COST_RETURN = 1
+_COST_LIST_ACCESS = 5
+_COST_DICT_ACCESS = 7
+_COST_MEMBER_ACCESS = 3
+
+# Structural costs
+_COST_CONDITION_CHECK = 5
+_COST_LIST_ELEMENT = 2
+_COST_DICT_PAIR = 3
+
+
 class EnergyBudgetExceeded(Exception):
     """Raised when a program exceeds the energy budget"""
     pass
 
 
+class CalleeCollector(ASTVisitor):
+    """
+    Collects the names each function calls, in a single pass
+    
+    Calls are attributed to the innermost enclosing function, so a
+    function is recursive exactly when its own name is in its callee set.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.callees: Dict[str, Set[str]] = {}
+        self.current_function = None
+        self._enclosing: List[Optional[str]] = []
+    
+    def collect(self, ast: Program) -> Dict[str, Set[str]]:
+        """Return a mapping of function name -> names it calls"""
+        self.callees = {}
+        self._enclosing = []
+        self.walk(ast)
+        return self.callees
+    
+    def enter_FunctionDef(self, node: FunctionDef):
+        """Enter function definition"""
+        self._enclosing.append(self.current_function)
+        self.current_function = node.name
+        self.callees.setdefault(node.name, set())
+    
+    def exit_FunctionDef(self, node: FunctionDef):
+        """Leave function definition"""
+        self.current_function = self._enclosing.pop()
+    
+    def enter_FunctionCall(self, node: FunctionCall):
+        """Enter function call"""
+        if self.current_function is not None and node.callee_name is not None:
+            self.callees[self.current_function].add(node.callee_name)
+
+
 class EnergyAnalyzer(ASTVisitor):
     """
     Analyzes and estimates the energy cost of a program
@@ -28,18 +83,19 @@ class EnergyAnalyzer(ASTVisitor):
     and enforces energy efficiency constraints.
     """
     
-    # Base costs for operations (in energy units)
+    # Base costs for operations (in energy units), for reference only:
+    # the hooks use the module-level constants directly
     BASE_COSTS = {
-        'literal': 1,
-        'variable': 1,
-        'assignment': 2,
-        'binary_op': 3,
-        'unary_op': 2,
-        'function_call': 10,
-        'return': 1,
-        'list_access': 5,
-        'dict_access': 7,
-        'member_access': 3,
+        'literal': _COST_LITERAL,
+        'variable': _COST_VARIABLE,
+        'assignment': _COST_ASSIGNMENT,
+        'binary_op': _COST_BINARY_OP,
+        'unary_op': _COST_UNARY_OP,
+        'function_call': _COST_FUNCTION_CALL,
+        'return': _COST_RETURN,
+        'list_access': _COST_LIST_ACCESS,
+        'dict_access': _COST_DICT_ACCESS,
+        'member_access': _COST_MEMBER_ACCESS,
     }
     
     # Loop iteration estimates for unbounded loops
@@ -54,13 +110,19 @@ class EnergyAnalyzer(ASTVisitor):
         Args:
             budget: Maximum allowed energy units (default: 1000)
         """
+        super().__init__()
         self.budget = budget
         self.total_cost = 0
         self.nesting_depth = 0
         self.function_costs: Dict[str, int] = {}
         self.recursive_functions: Set[str] = set()
+        self._callees: Dict[str, Set[str]] = {}
         self.current_function = None
         self.violations = []
+        # Work stacks for the iterative walk
+        self._enclosing: List[Optional[str]] = []
+        self._block_starts: List[int] = []
+        self._block_costs: List[int] = []
     
     def analyze(self, ast: Program) -> Dict[str, any]:
         """
@@ -69,14 +131,25 @@ class EnergyAnalyzer(ASTVisitor):
         Returns:
             Dictionary with analysis results including cost and violations
         """
-        self.total_cost = 0
-        self.violations = []
+        self.prepare(ast)
         
-        try:
-            self.visit(ast)
-        except EnergyBudgetExceeded:
-            pass  # We'll report it in the results
+        # The walk stops as soon as the budget is exceeded
+        self.walk(ast)
         
+        return self.results()
+    
+    def prepare(self, ast: Program):
+        """Reset state before walking a program"""
+        self.total_cost = 0
+        self.violations = []
+        self._callees = CalleeCollector().collect(ast)
+        self._enclosing = []
+        self._block_starts = []
+        self._block_costs = []
+        self._aborted = False
+    
+    def results(self) -> Dict[str, any]:
+        """Build the analysis results once the walk is done"""
         # Check if budget was exceeded
         if self.total_cost > self.budget:
             self.violations.append({
@@ -96,33 +169,43 @@ class EnergyAnalyzer(ASTVisitor):
     
     def add_cost(self, cost: int, description: str = ""):
         """Add cost and check budget"""
+        if self._aborted:
+            return
+        
         self.total_cost += cost
         if self.total_cost > self.budget:
-            raise EnergyBudgetExceeded(f"Energy budget exceeded (>{self.budget} units)")
+            self._aborted = True
     
-    def visit_Program(self, node: Program):
-        """Visit program node"""
-        for stmt in node.statements:
-            self.visit(stmt)
+    def enter_block(self, node: ASTNode, field_name: str):
+        """Open a cost frame for a nested block"""
+        self._block_starts.append(self.total_cost)
     
-    def visit_FunctionDef(self, node: FunctionDef):
-        """Visit function definition"""
-        old_function = self.current_function
-        self.current_function = node.name
-        
-        # Check for recursion by analyzing function calls in body
-        function_start_cost = self.total_cost
-        
-        # Visit function body
-        for stmt in node.body:
-            self.visit(stmt)
+    def exit_block(self, node: ASTNode, field_name: str):
+        """
+        Close a block's cost frame
         
+        The block's cost is taken back out of the total and handed to the
+        owning node, which adds it once, scaled as appropriate (max of the
+        branches, times the loop iterations, ...).
+        """
+        start = self._block_starts.pop()
+        self._block_costs.append(self.total_cost - start)
+        self.total_cost = start
+    
+    def enter_FunctionDef(self, node: FunctionDef):
+        """Enter function definition"""
+        self._enclosing.append(self.current_function)
+        self.current_function = node.name
+    
+    def exit_FunctionDef(self, node: FunctionDef):
+        """Leave function definition, once its body has been costed"""
         # Calculate function cost
-        function_cost = self.total_cost - function_start_cost
+        function_cost = self._block_costs.pop()
         self.function_costs[node.name] = function_cost
+        self.add_cost(function_cost)
         
         # Check for recursion
-        if self._contains_recursive_call(node.body, node.name):
+        if node.name in self._callees.get(node.name, ()):
             self.recursive_functions.add(node.name)
             # Penalize recursion heavily
             recursion_penalty = function_cost * self.MAX_RECURSION_DEPTH
@@ -134,90 +217,61 @@ class EnergyAnalyzer(ASTVisitor):
                 'penalty': recursion_penalty
             })
         
-        self.current_function = old_function
-    
-    def _contains_recursive_call(self, statements: List[ASTNode], function_name: str) -> bool:
-        """Check if statements contain a recursive call"""
-        for stmt in statements:
-            if isinstance(stmt, FunctionCall):
-                if isinstance(stmt.function, Variable) and stmt.function.name == function_name:
-                    return True
-            elif isinstance(stmt, (IfStatement, WhileLoop, ForLoop)):
-                if hasattr(stmt, 'body') and self._contains_recursive_call(stmt.body, function_name):
-                    return True
-                if isinstance(stmt, IfStatement) and stmt.else_body:
-                    if self._contains_recursive_call(stmt.else_body, function_name):
-                        return True
-        return False
-    
-    def visit_Assignment(self, node: Assignment):
-        """Visit assignment"""
-        self.add_cost(self.BASE_COSTS['assignment'])
-        self.visit(node.value)
-    
-    def visit_Variable(self, node: Variable):
-        """Visit variable reference"""
-        self.add_cost(self.BASE_COSTS['variable'])
-    
-    def visit_BinaryOp(self, node: BinaryOp):
-        """Visit binary operation"""
-        self.add_cost(self.BASE_COSTS['binary_op'])
-        self.visit(node.left)
-        self.visit(node.right)
-    
-    def visit_UnaryOp(self, node: UnaryOp):
-        """Visit unary operation"""
-        self.add_cost(self.BASE_COSTS['unary_op'])
-        self.visit(node.operand)
-    
-    def visit_Literal(self, node: Literal):
-        """Visit literal value"""
-        self.add_cost(self.BASE_COSTS['literal'])
-    
-    def visit_ListLiteral(self, node: ListLiteral):
-        """Visit list literal"""
+        self.current_function = self._enclosing.pop()
+    
+    def enter_Assignment(self, node: Assignment):
+        """Enter assignment"""
+        self.add_cost(_COST_ASSIGNMENT)
+    
+    def enter_Variable(self, node: Variable):
+        """Enter variable reference"""
+        self.add_cost(_COST_VARIABLE)
+    
+    def enter_BinaryOp(self, node: BinaryOp):
+        """Enter binary operation"""
+        self.add_cost(_COST_BINARY_OP)
+    
+    def enter_UnaryOp(self, node: UnaryOp):
+        """Enter unary operation"""
+        self.add_cost(_COST_UNARY_OP)
+    
+    def enter_Literal(self, node: Literal):
+        """Enter literal value"""
+        self.add_cost(_COST_LITERAL)
+    
+    def enter_ListLiteral(self, node: ListLiteral):
+        """Enter list literal"""
         # Cost proportional to number of elements
-        self.add_cost(len(node.elements) * 2)
-        for elem in node.elements:
-            self.visit(elem)
+        self.add_cost(len(node.elements) * _COST_LIST_ELEMENT)
     
-    def visit_DictLiteral(self, node: DictLiteral):
-        """Visit dictionary literal"""
+    def enter_DictLiteral(self, node: DictLiteral):
+        """Enter dictionary literal"""
         # Dicts are more expensive than lists
-        self.add_cost(len(node.pairs) * 3)
-        for key, value in node.pairs:
-            self.visit(key)
-            self.visit(value)
-    
-    def visit_IfStatement(self, node: IfStatement):
-        """Visit if statement"""
-        self.add_cost(5)  # Cost of condition check
-        self.visit(node.condition)
-        
+        self.add_cost(len(node.pairs) * _COST_DICT_PAIR)
+    
+    def enter_IfStatement(self, node: IfStatement):
+        """Enter if statement"""
+        self.add_cost(_COST_CONDITION_CHECK)
+    
+    def exit_IfStatement(self, node: IfStatement):
+        """Leave if statement, once both branches have been costed"""
         # Assume both branches might execute (conservative estimate)
-        then_cost = self._estimate_block_cost(node.then_body)
-        else_cost = self._estimate_block_cost(node.else_body) if node.else_body else 0
+        else_cost = self._block_costs.pop() if node.else_body is not None else 0
+        then_cost = self._block_costs.pop()
         
         # Add the maximum of both branches
         max_branch_cost = max(then_cost, else_cost)
         self.add_cost(max_branch_cost)
     
-    def visit_WhileLoop(self, node: WhileLoop):
-        """Visit while loop"""
-        self.nesting_depth += 1
-        
-        # Check nesting depth
-        if self.nesting_depth > self.MAX_NESTING_DEPTH:
-            self.violations.append({
-                'type': 'excessive_nesting',
-                'message': f'Loop nesting depth ({self.nesting_depth}) exceeds maximum ({self.MAX_NESTING_DEPTH})',
-                'depth': self.nesting_depth
-            })
+    def enter_WhileLoop(self, node: WhileLoop):
+        """Enter while loop"""
+        self._enter_loop()
+    
+    def exit_WhileLoop(self, node: WhileLoop):
+        """Leave while loop, once its body has been costed"""
+        body_cost = self._block_costs.pop()
         
         # Unbounded loop - assume worst case iterations
-        self.visit(node.condition)
-        body_cost = self._estimate_block_cost(node.body)
-        
         # Multiply by assumed iterations with exponential penalty for nesting
         multiplier = self.ASSUMED_LOOP_ITERATIONS * (2 ** (self.nesting_depth - 1))
         loop_cost = body_cost * multiplier
@@ -233,27 +287,19 @@ class EnergyAnalyzer(ASTVisitor):
         
         self.nesting_depth -= 1
     
-    def visit_ForLoop(self, node: ForLoop):
-        """Visit for loop"""
-        self.nesting_depth += 1
-        
-        # Check nesting depth
-        if self.nesting_depth > self.MAX_NESTING_DEPTH:
-            self.violations.append({
-                'type': 'excessive_nesting',
-                'message': f'Loop nesting depth ({self.nesting_depth}) exceeds maximum ({self.MAX_NESTING_DEPTH})',
-                'depth': self.nesting_depth
-            })
-        
-        self.visit(node.iterable)
+    def enter_ForLoop(self, node: ForLoop):
+        """Enter for loop"""
+        self._enter_loop()
+    
+    def exit_ForLoop(self, node: ForLoop):
+        """Leave for loop, once its body has been costed"""
+        body_cost = self._block_costs.pop()
         
         # Try to estimate iterations from iterable
         iterations = self.ASSUMED_LOOP_ITERATIONS
         if isinstance(node.iterable, ListLiteral):
             iterations = len(node.iterable.elements)
         
-        body_cost = self._estimate_block_cost(node.body)
-        
         # Multiply by iterations with exponential penalty for nesting
         multiplier = iterations * (2 ** (self.nesting_depth - 1))
         loop_cost = body_cost * multiplier
@@ -269,52 +315,37 @@ class EnergyAnalyzer(ASTVisitor):
         
         self.nesting_depth -= 1
     
-    def visit_ReturnStatement(self, node: ReturnStatement):
-        """Visit return statement"""
-        self.add_cost(self.BASE_COSTS['return'])
-        if node.value:
-            self.visit(node.value)
-    
-    def visit_FunctionCall(self, node: FunctionCall):
-        """Visit function call"""
-        base_call_cost = self.BASE_COSTS['function_call']
-        self.add_cost(base_call_cost)
-        
-        # Visit function expression and arguments
-        self.visit(node.function)
-        for arg in node.arguments:
-            self.visit(arg)
+    def _enter_loop(self):
+        """Track loop nesting on entering a loop"""
+        self.nesting_depth += 1
         
+        # Check nesting depth
+        if self.nesting_depth > self.MAX_NESTING_DEPTH:
+            self.violations.append({
+                'type': 'excessive_nesting',
+                'message': f'Loop nesting depth ({self.nesting_depth}) exceeds maximum ({self.MAX_NESTING_DEPTH})',
+                'depth': self.nesting_depth
+            })
+    
+    def enter_ReturnStatement(self, node: ReturnStatement):
+        """Enter return statement"""
+        self.add_cost(_COST_RETURN)
+    
+    def enter_FunctionCall(self, node: FunctionCall):
+        """Enter function call"""
+        self.add_cost(_COST_FUNCTION_CALL)
+    
+    def exit_FunctionCall(self, node: FunctionCall):
+        """Leave function call, once its arguments have been costed"""
         # If we know the function's cost, add it
-        if isinstance(node.function, Variable):
-            func_name = node.function.name
-            if func_name in self.function_costs:
-                self.add_cost(self.function_costs[func_name])
-    
-    def visit_MemberAccess(self, node: MemberAccess):
-        """Visit member access"""
-        self.add_cost(self.BASE_COSTS['member_access'])
-        self.visit(node.object)
-    
-    def visit_IndexAccess(self, node: IndexAccess):
-        """Visit index access"""
-        self.add_cost(self.BASE_COSTS['list_access'])
-        self.visit(node.object)
-        self.visit(node.index)
-    
-    def visit_Annotation(self, node: Annotation):
-        """Visit annotation"""
-        # Annotations don't have runtime cost
-        pass
-    
-    def _estimate_block_cost(self, statements: List[ASTNode]) -> int:
-        """Estimate the cost of a block of statements"""
-        if not statements:
-            return 0
-        
-        start_cost = self.total_cost
-        for stmt in statements:
-            self.visit(stmt)
-        end_cost = self.total_cost
-        
-        return end_cost - start_cost
+        func_name = node.callee_name
+        if func_name in self.function_costs:
+            self.add_cost(self.function_costs[func_name])
+    
+    def enter_MemberAccess(self, node: MemberAccess):
+        """Enter member access"""
+        self.add_cost(_COST_MEMBER_ACCESS)
+    
+    def enter_IndexAccess(self, node: IndexAccess):
+        """Enter index access"""
+        self.add_cost(_COST_LIST_ACCESS)
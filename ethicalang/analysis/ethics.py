@@ -11,7 +11,8 @@ Key Features:
 - Maintains a registry of disallowed operations
 """
 
-from typing import List, Dict, Set
+import re
+from typing import List, Dict, FrozenSet, Set
 from ..ast.nodes import *
 
 
@@ -29,7 +30,7 @@ class EthicsChecker(ASTVisitor):
     """
     
     # Sensitive function patterns that require user consent
-    REQUIRES_CONSENT = {
+    REQUIRES_CONSENT = frozenset({
         'collect_location', 'get_gps', 'track_location', 'get_location',
         'collect_biometric', 'get_fingerprint', 'get_face', 'scan_face',
         'record_audio', 'access_microphone', 'record_video', 'access_camera',
@@ -37,14 +38,14 @@ class EthicsChecker(ASTVisitor):
         'read_messages', 'access_messages', 'read_sms',
         'track_user', 'track_behavior', 'log_activity', 'monitor_user',
         'collect_data', 'collect_personal_info', 'gather_user_data',
-    }
+    })
     
     # Operations that require data protection
-    REQUIRES_DATA_PROTECTION = {
+    REQUIRES_DATA_PROTECTION = frozenset({
         'store_password', 'save_password', 'store_credential',
         'store_payment', 'process_payment', 'save_card',
         'store_ssn', 'store_personal_id', 'save_sensitive_data',
-    }
+    })
     
     # Disallowed operations (facial recognition, dark patterns, etc.)
     DISALLOWED_OPERATIONS = {
@@ -59,6 +60,27 @@ class EthicsChecker(ASTVisitor):
         'hidden_charges': 'Hidden charges are unethical',
     }
     
+    # Matches a name containing any disallowed operation, so names that
+    # contain none are rejected in one scan
+    _DISALLOWED_RE = re.compile(
+        '|'.join(re.escape(operation) for operation in DISALLOWED_OPERATIONS),
+        re.IGNORECASE
+    )
+    
+    # Substrings of variable names that suggest sensitive data
+    SENSITIVE_NAME_HINTS = ('password', 'ssn', 'credit_card', 'secret_key', 'api_key')
+    _SENSITIVE_NAME_RE = re.compile(
+        '|'.join(re.escape(hint) for hint in SENSITIVE_NAME_HINTS),
+        re.IGNORECASE
+    )
+    
+    # Substrings of string literals that suggest a hardcoded secret
+    SECRET_KEYWORDS = ('password', 'secret', 'api_key', 'token')
+    _SECRET_RE = re.compile(
+        '|'.join(re.escape(keyword) for keyword in SECRET_KEYWORDS),
+        re.IGNORECASE
+    )
+    
     # Required annotations for sensitive operations
     REQUIRED_ANNOTATIONS = {
         'requires_user_consent': REQUIRES_CONSENT,
@@ -72,10 +94,15 @@ class EthicsChecker(ASTVisitor):
         Args:
             strict_mode: If True, enforce all rules strictly
         """
+        super().__init__()
         self.strict_mode = strict_mode
         self.violations = []
+        # Violations recorded during the walk, as compact tuples
+        self._found: List[tuple] = []
         self.current_function = None
-        self.current_annotations = []
+        self.current_annotations = frozenset()
+        # Enclosing (function, annotations), restored on leaving a function
+        self._saved_state: List[tuple] = []
     
     def analyze(self, ast: Program) -> Dict[str, any]:
         """
@@ -84,13 +111,25 @@ class EthicsChecker(ASTVisitor):
         Returns:
             Dictionary with analysis results
         """
-        self.violations = []
+        self.prepare(ast)
         
-        try:
-            self.visit(ast)
-        except EthicalViolation:
-            pass  # Violations are collected
+        # In strict mode the walk stops at the first violation
+        self.walk(ast)
         
+        return self.results()
+    
+    def prepare(self, ast: Program):
+        """Reset state before walking a program"""
+        self.violations = []
+        self._found = []
+        self.current_function = None
+        self.current_annotations = frozenset()
+        self._saved_state = []
+        self._aborted = False
+    
+    def results(self) -> Dict[str, any]:
+        """Build the analysis results once the walk is done"""
+        self.violations = [self._as_dict(found) for found in self._found]
         return {
             'passed': len(self.violations) == 0,
             'violations': self.violations,
@@ -99,45 +138,44 @@ class EthicsChecker(ASTVisitor):
     
     def add_violation(self, violation_type: str, message: str, details: Dict = None):
         """Add an ethical violation"""
+        if self._aborted:
+            return
+        
+        # Stored as a tuple; results() builds the reported dict
+        self._found.append((violation_type, message, self.current_function, details))
+        
+        if self.strict_mode:
+            self._aborted = True
+    
+    @staticmethod
+    def _as_dict(found: tuple) -> Dict:
+        """Build the reported dict for a recorded violation"""
+        violation_type, message, function, details = found
         violation = {
             'type': violation_type,
             'message': message,
-            'function': self.current_function
+            'function': function
         }
         if details:
             violation.update(details)
-        self.violations.append(violation)
-        
-        if self.strict_mode:
-            raise EthicalViolation(message)
-    
-    def visit_Program(self, node: Program):
-        """Visit program node"""
-        for stmt in node.statements:
-            self.visit(stmt)
+        return violation
     
-    def visit_FunctionDef(self, node: FunctionDef):
-        """Visit function definition"""
-        old_function = self.current_function
-        old_annotations = self.current_annotations
+    def enter_FunctionDef(self, node: FunctionDef):
+        """Enter function definition"""
+        self._saved_state.append((self.current_function, self.current_annotations))
         
         self.current_function = node.name
-        self.current_annotations = [ann.name for ann in node.annotations]
+        self.current_annotations = node.annotation_names
         
         # Check if function name suggests sensitive operation
-        self._check_function_name(node.name, node.annotations)
-        
-        # Visit function body
-        for stmt in node.body:
-            self.visit(stmt)
-        
-        self.current_function = old_function
-        self.current_annotations = old_annotations
+        self._check_function_name(node.name, node.annotation_names)
+    
+    def exit_FunctionDef(self, node: FunctionDef):
+        """Leave function definition"""
+        self.current_function, self.current_annotations = self._saved_state.pop()
     
-    def _check_function_name(self, function_name: str, annotations: List[Annotation]):
+    def _check_function_name(self, function_name: str, annotation_names: FrozenSet[str]):
         """Check if function name requires specific annotations"""
-        annotation_names = [ann.name for ann in annotations]
-        
         # Check for consent-requiring operations
         if function_name in self.REQUIRES_CONSENT:
             if 'requires_user_consent' not in annotation_names:
@@ -157,20 +195,21 @@ class EthicsChecker(ASTVisitor):
                 )
         
         # Check for disallowed operations
-        for disallowed, reason in self.DISALLOWED_OPERATIONS.items():
-            if disallowed in function_name.lower():
-                self.add_violation(
-                    'disallowed_operation',
-                    f'Function "{function_name}" performs disallowed operation: {reason}',
-                    {'operation': disallowed}
-                )
+        if self._DISALLOWED_RE.search(function_name):
+            name_lower = function_name.lower()
+            for disallowed, reason in self.DISALLOWED_OPERATIONS.items():
+                if disallowed in name_lower:
+                    self.add_violation(
+                        'disallowed_operation',
+                        f'Function "{function_name}" performs disallowed operation: {reason}',
+                        {'operation': disallowed}
+                    )
     
-    def visit_FunctionCall(self, node: FunctionCall):
-        """Visit function call"""
+    def enter_FunctionCall(self, node: FunctionCall):
+        """Enter function call"""
         # Check if calling sensitive functions
-        if isinstance(node.function, Variable):
-            func_name = node.function.name
-            
+        func_name = node.callee_name
+        if func_name is not None:
             # Check for consent-requiring calls
             if func_name in self.REQUIRES_CONSENT:
                 if 'requires_user_consent' not in self.current_annotations:
@@ -190,108 +229,44 @@ class EthicsChecker(ASTVisitor):
                     )
             
             # Check for disallowed operations
-            for disallowed, reason in self.DISALLOWED_OPERATIONS.items():
-                if disallowed in func_name.lower():
-                    self.add_violation(
-                        'disallowed_operation_call',
-                        f'Calling "{func_name}": {reason}',
-                        {'operation': disallowed}
-                    )
-        
-        # Visit function and arguments
-        self.visit(node.function)
-        for arg in node.arguments:
-            self.visit(arg)
+            if self._DISALLOWED_RE.search(func_name):
+                name_lower = func_name.lower()
+                for disallowed, reason in self.DISALLOWED_OPERATIONS.items():
+                    if disallowed in name_lower:
+                        self.add_violation(
+                            'disallowed_operation_call',
+                            f'Calling "{func_name}": {reason}',
+                            {'operation': disallowed}
+                        )
     
-    def visit_Assignment(self, node: Assignment):
-        """Visit assignment"""
+    def enter_Assignment(self, node: Assignment):
+        """Enter assignment"""
         # Check for suspicious variable names that might indicate data collection
-        suspicious_names = ['password', 'ssn', 'credit_card', 'secret_key', 'api_key']
-        for suspicious in suspicious_names:
-            if suspicious in node.name.lower():
-                if 'requires_data_protection' not in self.current_annotations:
-                    self.add_violation(
-                        'unprotected_sensitive_data',
-                        f'Variable "{node.name}" appears to contain sensitive data but function lacks @requires_data_protection',
-                        {'variable': node.name, 'hint': suspicious}
-                    )
-        
-        self.visit(node.value)
-    
-    def visit_Variable(self, node: Variable):
-        """Visit variable reference"""
-        pass
-    
-    def visit_BinaryOp(self, node: BinaryOp):
-        """Visit binary operation"""
-        self.visit(node.left)
-        self.visit(node.right)
+        if self._SENSITIVE_NAME_RE.search(node.name):
+            name_lower = node.name.lower()
+            for suspicious in self.SENSITIVE_NAME_HINTS:
+                if suspicious in name_lower:
+                    if 'requires_data_protection' not in self.current_annotations:
+                        self.add_violation(
+                            'unprotected_sensitive_data',
+                            f'Variable "{node.name}" appears to contain sensitive data but function lacks @requires_data_protection',
+                            {'variable': node.name, 'hint': suspicious}
+                        )
     
-    def visit_UnaryOp(self, node: UnaryOp):
-        """Visit unary operation"""
-        self.visit(node.operand)
-    
-    def visit_Literal(self, node: Literal):
-        """Visit literal value"""
+    def enter_StringLiteral(self, node: StringLiteral):
+        """Enter string literal"""
         # Check for hardcoded sensitive strings
-        if node.type_name == 'string':
-            value_lower = str(node.value).lower()
-            if any(keyword in value_lower for keyword in ['password', 'secret', 'api_key', 'token']):
-                self.add_violation(
-                    'hardcoded_secret',
-                    f'Potential hardcoded secret detected: "{node.value[:20]}..."',
-                    {'value_preview': str(node.value)[:30]}
-                )
-    
-    def visit_ListLiteral(self, node: ListLiteral):
-        """Visit list literal"""
-        for elem in node.elements:
-            self.visit(elem)
-    
-    def visit_DictLiteral(self, node: DictLiteral):
-        """Visit dictionary literal"""
-        for key, value in node.pairs:
-            self.visit(key)
-            self.visit(value)
-    
-    def visit_IfStatement(self, node: IfStatement):
-        """Visit if statement"""
-        self.visit(node.condition)
-        for stmt in node.then_body:
-            self.visit(stmt)
-        if node.else_body:
-            for stmt in node.else_body:
-                self.visit(stmt)
-    
-    def visit_WhileLoop(self, node: WhileLoop):
-        """Visit while loop"""
-        self.visit(node.condition)
-        for stmt in node.body:
-            self.visit(stmt)
-    
-    def visit_ForLoop(self, node: ForLoop):
-        """Visit for loop"""
-        self.visit(node.iterable)
-        for stmt in node.body:
-            self.visit(stmt)
-    
-    def visit_ReturnStatement(self, node: ReturnStatement):
-        """Visit return statement"""
-        if node.value:
-            self.visit(node.value)
-    
-    def visit_MemberAccess(self, node: MemberAccess):
-        """Visit member access"""
-        self.visit(node.object)
-    
-    def visit_IndexAccess(self, node: IndexAccess):
-        """Visit index access"""
-        self.visit(node.object)
-        self.visit(node.index)
-    
-    def visit_Annotation(self, node: Annotation):
-        """Visit annotation"""
-        pass
+        # The regex only screens; case-insensitive matching folds some
+        # characters (e.g. 'ſ') that str.lower() keeps, so confirm with it
+        text = str(node.value)
+        if self._SECRET_RE.search(text) and any(
+            keyword in text.lower() for keyword in self.SECRET_KEYWORDS
+        ):
+            self.add_violation(
+                'hardcoded_secret',
+                f'Potential hardcoded secret detected: "{text[:20]}..."',
+                {'value_preview': text[:30]}
+            )
 
 
 def format_ethics_report(results: Dict) -> str:
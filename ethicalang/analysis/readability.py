@@ -13,10 +13,20 @@ Rejects programs below a configurable threshold.
 
 import math
 import re
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from ..ast.nodes import *
 
 
+# Variable naming checks, built once rather than on every name scored
+_SNAKE_CASE_RE = re.compile(r'^[a-z][a-z0-9_]*$')
+_BAD_NAMES = frozenset({'temp', 'tmp', 'data', 'var', 'val', 'foo', 'bar', 'baz', 'x1', 'x2'})
+_SHORT_NAMES_OK = frozenset('ijxyznkv')
+
+# Naming problems reported as issues, as flags returned by _score_variable_name
+_NAME_TOO_SHORT = 1
+_NAME_NOT_DESCRIPTIVE = 2
+
+
 class ReadabilityError(Exception):
     """Raised when code fails readability requirements"""
     pass
@@ -46,6 +56,7 @@ class ReadabilityScorer(ASTVisitor):
         Args:
             min_score: Minimum required score (0-100, default: 70)
         """
+        super().__init__()
         self.min_score = min_score
         self.scores = {
             'complexity': 100,
@@ -62,6 +73,9 @@ class ReadabilityScorer(ASTVisitor):
         self.max_nesting = 0
         self.complexity = 0
         self.variable_names = []
+        self._stmt_counter = 0
+        # Enclosing function state, restored on leaving a function
+        self._saved_state: List[tuple] = []
     
     def analyze(self, ast: Program) -> Dict[str, any]:
         """
@@ -70,12 +84,29 @@ class ReadabilityScorer(ASTVisitor):
         Returns:
             Dictionary with score and detailed breakdown
         """
-        self.issues = []
-        self.function_stats = {}
+        self.prepare(ast)
         
-        # Visit the AST
-        self.visit(ast)
+        # Walk the AST
+        self.walk(ast)
         
+        return self.results()
+    
+    def prepare(self, ast: Program):
+        """Reset state before walking a program"""
+        self.scores = dict.fromkeys(self.scores, 100)
+        self.issues = []
+        self.current_function = None
+        self.function_stats = {}
+        self.nesting_depth = 0
+        self.max_nesting = 0
+        self.complexity = 0
+        self.variable_names = []
+        self._saved_state = []
+        self._stmt_counter = 0
+        self._aborted = False
+    
+    def results(self) -> Dict[str, any]:
+        """Score the program once the walk is done"""
         # Calculate individual scores
         self._calculate_scores()
         
@@ -168,210 +199,164 @@ class ReadabilityScorer(ASTVisitor):
         if not self.variable_names:
             return 100
         
+        # Names repeat a lot (loop counters, accumulators), so each distinct
+        # name is scored once
+        scored = {}
+        flagged = []
         total_score = 0
         for name in self.variable_names:
-            score = self._score_variable_name(name)
+            try:
+                score, flags = scored[name]
+            except KeyError:
+                score, flags = scored[name] = self._score_variable_name(name)
+            if flags:
+                flagged.append((name, flags))
             total_score += score
         
+        # Report only the offending names, once scoring is done
+        for name, flags in flagged:
+            if flags & _NAME_TOO_SHORT:
+                self.issues.append({
+                    'type': 'short_variable_name',
+                    'message': f'Variable name "{name}" is too short (< {self.MIN_VARIABLE_NAME_LENGTH} characters)',
+                    'variable': name
+                })
+            if flags & _NAME_NOT_DESCRIPTIVE:
+                self.issues.append({
+                    'type': 'non_descriptive_name',
+                    'message': f'Variable name "{name}" is not descriptive',
+                    'variable': name
+                })
+        
         return (total_score / len(self.variable_names)) * 100
     
-    def _score_variable_name(self, name: str) -> float:
+    def _score_variable_name(self, name: str) -> Tuple[float, int]:
         """
         Score an individual variable name (0.0 - 1.0)
         
+        Returns the score along with the _NAME_* flags for the problems
+        to report as issues.
+        
         Factors:
         - Length (too short or too long is bad)
         - Descriptiveness (words vs abbreviations)
         - Convention (snake_case for Python-like language)
         """
         score = 1.0
+        flags = 0
         
         # Check length
         if len(name) < self.MIN_VARIABLE_NAME_LENGTH:
             score -= 0.3
-            self.issues.append({
-                'type': 'short_variable_name',
-                'message': f'Variable name "{name}" is too short (< {self.MIN_VARIABLE_NAME_LENGTH} characters)',
-                'variable': name
-            })
+            flags |= _NAME_TOO_SHORT
         elif len(name) > 30:
             score -= 0.2
         
         # Check for single letter names (except common ones like i, j, x, y)
-        if len(name) == 1 and name not in 'ijxyznkv':
+        if len(name) == 1 and name not in _SHORT_NAMES_OK:
             score -= 0.4
         
         # Check for common bad names
-        bad_names = {'temp', 'tmp', 'data', 'var', 'val', 'foo', 'bar', 'baz', 'x1', 'x2'}
-        if name.lower() in bad_names:
+        if name.lower() in _BAD_NAMES:
             score -= 0.5
-            self.issues.append({
-                'type': 'non_descriptive_name',
-                'message': f'Variable name "{name}" is not descriptive',
-                'variable': name
-            })
+            flags |= _NAME_NOT_DESCRIPTIVE
         
         # Prefer snake_case
-        if not re.match(r'^[a-z][a-z0-9_]*$', name):
+        if not _SNAKE_CASE_RE.match(name):
             score -= 0.1
         
         # Reward longer, meaningful names
         if len(name) >= 5 and '_' in name:
             score += 0.2
         
-        return max(0.0, min(1.0, score))
-    
-    def _count_statements(self, statements: List[ASTNode]) -> int:
-        """Count the number of statements in a block"""
-        count = 0
-        for stmt in statements:
-            count += 1
-            if isinstance(stmt, IfStatement):
-                count += self._count_statements(stmt.then_body)
-                if stmt.else_body:
-                    count += self._count_statements(stmt.else_body)
-            elif isinstance(stmt, (WhileLoop, ForLoop)):
-                count += self._count_statements(stmt.body)
-        return count
+        return max(0.0, min(1.0, score)), flags
     
-    def visit_Program(self, node: Program):
-        """Visit program node"""
-        for stmt in node.statements:
-            self.visit(stmt)
-    
-    def visit_FunctionDef(self, node: FunctionDef):
-        """Visit function definition"""
-        old_function = self.current_function
-        old_complexity = self.complexity
-        old_max_nesting = self.max_nesting
-        old_nesting = self.nesting_depth
+    def enter_FunctionDef(self, node: FunctionDef):
+        """Enter function definition"""
+        self._saved_state.append((
+            self.current_function,
+            self.complexity,
+            self.max_nesting,
+            self.nesting_depth,
+            self._stmt_counter,
+        ))
         
         self.current_function = node.name
         self.complexity = 1  # Base complexity
         self.max_nesting = 0
         self.nesting_depth = 0
-        
-        # Visit function body
-        for stmt in node.body:
-            self.visit(stmt)
+    
+    def exit_FunctionDef(self, node: FunctionDef):
+        """Leave function definition, once its body has been visited"""
+        # Statements counted in this body's blocks, nested ones included
+        old_function, old_complexity, old_max_nesting, old_nesting, old_counter = self._saved_state.pop()
+        function_length = self._stmt_counter - old_counter
         
         # Calculate function statistics
-        function_length = self._count_statements(node.body)
         self.function_stats[node.name] = {
             'length': function_length,
             'complexity': self.complexity,
             'max_nesting': self.max_nesting,
         }
         
-        # Restore state
+        # Restore state; a nested function's body doesn't count toward
+        # the enclosing function's length
         self.current_function = old_function
         self.complexity = old_complexity + self.complexity
         self.max_nesting = max(old_max_nesting, self.max_nesting)
         self.nesting_depth = old_nesting
+        self._stmt_counter = old_counter
+    
+    def enter_block(self, node: ASTNode, field_name: str):
+        """Count the statements of a block (function, branch or loop body)"""
+        self._stmt_counter += len(getattr(node, field_name))
     
-    def visit_Assignment(self, node: Assignment):
-        """Visit assignment"""
+    def enter_Assignment(self, node: Assignment):
+        """Enter assignment"""
         if node.is_declaration:
             self.variable_names.append(node.name)
-        self.visit(node.value)
-    
-    def visit_Variable(self, node: Variable):
-        """Visit variable reference"""
-        pass
     
-    def visit_BinaryOp(self, node: BinaryOp):
-        """Visit binary operation"""
+    def enter_BinaryOp(self, node: BinaryOp):
+        """Enter binary operation"""
         # Logical operators increase complexity
         if node.operator in ('and', 'or'):
             self.complexity += 1
-        
-        self.visit(node.left)
-        self.visit(node.right)
-    
-    def visit_UnaryOp(self, node: UnaryOp):
-        """Visit unary operation"""
-        self.visit(node.operand)
-    
-    def visit_Literal(self, node: Literal):
-        """Visit literal value"""
-        pass
     
-    def visit_ListLiteral(self, node: ListLiteral):
-        """Visit list literal"""
-        for elem in node.elements:
-            self.visit(elem)
-    
-    def visit_DictLiteral(self, node: DictLiteral):
-        """Visit dictionary literal"""
-        for key, value in node.pairs:
-            self.visit(key)
-            self.visit(value)
-    
-    def visit_IfStatement(self, node: IfStatement):
-        """Visit if statement"""
+    def enter_IfStatement(self, node: IfStatement):
+        """Enter if statement"""
         self.complexity += 1  # Each branch adds complexity
-        self.nesting_depth += 1
-        self.max_nesting = max(self.max_nesting, self.nesting_depth)
-        
-        self.visit(node.condition)
-        for stmt in node.then_body:
-            self.visit(stmt)
-        
         if node.else_body:
             self.complexity += 1  # Else branch adds complexity
-            for stmt in node.else_body:
-                self.visit(stmt)
-        
+        self._enter_nested()
+    
+    def exit_IfStatement(self, node: IfStatement):
+        """Leave if statement"""
         self.nesting_depth -= 1
     
-    def visit_WhileLoop(self, node: WhileLoop):
-        """Visit while loop"""
+    def enter_WhileLoop(self, node: WhileLoop):
+        """Enter while loop"""
         self.complexity += 1
-        self.nesting_depth += 1
-        self.max_nesting = max(self.max_nesting, self.nesting_depth)
-        
-        self.visit(node.condition)
-        for stmt in node.body:
-            self.visit(stmt)
-        
+        self._enter_nested()
+    
+    def exit_WhileLoop(self, node: WhileLoop):
+        """Leave while loop"""
         self.nesting_depth -= 1
     
-    def visit_ForLoop(self, node: ForLoop):
-        """Visit for loop"""
+    def enter_ForLoop(self, node: ForLoop):
+        """Enter for loop"""
         self.complexity += 1
-        self.nesting_depth += 1
-        self.max_nesting = max(self.max_nesting, self.nesting_depth)
-        
+        self._enter_nested()
         self.variable_names.append(node.variable)
-        self.visit(node.iterable)
-        for stmt in node.body:
-            self.visit(stmt)
-        
-        self.nesting_depth -= 1
-    
-    def visit_ReturnStatement(self, node: ReturnStatement):
-        """Visit return statement"""
-        if node.value:
-            self.visit(node.value)
-    
-    def visit_FunctionCall(self, node: FunctionCall):
-        """Visit function call"""
-        self.visit(node.function)
-        for arg in node.arguments:
-            self.visit(arg)
     
-    def visit_MemberAccess(self, node: MemberAccess):
-        """Visit member access"""
-        self.visit(node.object)
-    
-    def visit_IndexAccess(self, node: IndexAccess):
-        """Visit index access"""
-        self.visit(node.object)
-        self.visit(node.index)
+    def exit_ForLoop(self, node: ForLoop):
+        """Leave for loop"""
+        self.nesting_depth -= 1
     
-    def visit_Annotation(self, node: Annotation):
-        """Visit annotation"""
-        pass
+    def _enter_nested(self):
+        """Track nesting on entering a branch or loop"""
+        depth = self.nesting_depth = self.nesting_depth + 1
+        if depth > self.max_nesting:
+            self.max_nesting = depth
 
 
 def format_readability_report(results: Dict) -> str:
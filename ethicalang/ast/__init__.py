@@ -5,5 +5,6 @@ __all__ = [
     'ASTNode', 'Program', 'FunctionDef', 'Assignment', 'Variable',
     'BinaryOp', 'UnaryOp', 'Literal', 'IfStatement', 'WhileLoop',
     'ForLoop', 'ReturnStatement', 'FunctionCall', 'ListLiteral',
-    'DictLiteral', 'Annotation'
+    'DictLiteral', 'StringLiteral', 'NumericLiteral', 'BoolLiteral',
+    'Annotation', 'ASTVisitor', 'iter_children'
 ]
@@ -5,53 +5,153 @@ This module defines all AST node types used to represent parsed programs.
 Each node type corresponds to a language construct.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Any
-from abc import ABC, abstractmethod
+from typing import List, Optional, Any, FrozenSet, Tuple, Union, get_args, get_origin
 
 
-class ASTNode(ABC):
-    """Base class for all AST nodes"""
+# Node classes are slotted where dataclasses support it (Python 3.10+);
+# on 3.9 they fall back to an instance __dict__ and behave the same
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Kinds of child fields, used by ASTVisitor.walk
+CHILD_NODE = 0      # a single node (possibly None)
+CHILD_LIST = 1      # a list of nodes
+CHILD_BLOCK = 2     # a nested block of statements
+CHILD_PAIRS = 3     # a list of (node, node) pairs
+
+# Statement lists that form a nested block (loop/branch/function bodies)
+BLOCK_FIELDS = frozenset({'body', 'then_body', 'else_body'})
+
+# Fields holding compile-time metadata that traversals never descend into
+METADATA_FIELDS = frozenset({'annotations'})
+
+# Expression shapes, used to compute expression depth without isinstance checks
+DEPTH_LEAF = 0       # literals, variables and anything else of depth 1
+DEPTH_BINARY = 1     # left/right operands
+DEPTH_UNARY = 2      # single operand
+DEPTH_CALL = 3       # function call arguments
+DEPTH_ACCESS = 4     # member/index access on an object
+DEPTH_CONTAINER = 5  # list/dict literals
+
+
+def _child_kind(name: str, hint) -> Optional[int]:
+    """Classify an annotated field as a child field, or None for scalars"""
+    if get_origin(hint) is Union:
+        args = [arg for arg in get_args(hint) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        hint = args[0]
     
-    @abstractmethod
-    def __repr__(self):
-        pass
+    if isinstance(hint, type) and issubclass(hint, ASTNode):
+        return CHILD_NODE
+    
+    # Child sequences are tuples: the tree is immutable once parsed
+    if get_origin(hint) is tuple:
+        args = get_args(hint)
+        if len(args) != 2 or args[1] is not Ellipsis:
+            return None
+        item = args[0]
+        if get_origin(item) is tuple:
+            return CHILD_PAIRS
+        if isinstance(item, type) and issubclass(item, ASTNode):
+            return CHILD_BLOCK if name in BLOCK_FIELDS else CHILD_LIST
+    
+    return None
 
 
-@dataclass
+class ASTNode:
+    """Base class for all AST nodes"""
+    
+    # Node classes are slotted dataclasses (see _SLOTS): no per-instance
+    # __dict__ on Python 3.10+
+    __slots__ = ()
+    
+    _child_fields = ()
+    _node_fields = ()
+    _node_list_fields = ()
+    _scalar_fields = ()
+    _depth_kind = DEPTH_LEAF
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolved once per node class so visitors never rebuild the names.
+        # Most specific class first: a visitor handling Literal also
+        # handles StringLiteral unless it defines a StringLiteral method.
+        node_names = [
+            base.__name__ for base in cls.__mro__
+            if issubclass(base, ASTNode) and base is not ASTNode
+        ]
+        cls._visit_names = tuple(f'visit_{name}' for name in node_names)
+        cls._enter_names = tuple(f'enter_{name}' for name in node_names)
+        cls._exit_names = tuple(f'exit_{name}' for name in node_names)
+        
+        # Child fields in visit order, classified once from the annotations
+        # (including those inherited from a base node class)
+        annotations = {}
+        for base in reversed(cls.__mro__):
+            annotations.update(base.__dict__.get('__annotations__', {}))
+        children = []
+        scalars = []
+        for name, hint in annotations.items():
+            if name in METADATA_FIELDS:
+                continue
+            kind = _child_kind(name, hint)
+            if kind is None:
+                scalars.append(name)
+            else:
+                children.append((name, kind))
+        cls._child_fields = tuple(children)
+        cls._node_fields = tuple(name for name, kind in children if kind == CHILD_NODE)
+        cls._node_list_fields = tuple(
+            name for name, kind in children if kind in (CHILD_LIST, CHILD_BLOCK)
+        )
+        cls._scalar_fields = tuple(scalars)
+
+
+@dataclass(**_SLOTS)
 class Program(ASTNode):
     """Root node representing an entire program"""
-    statements: List[ASTNode]
+    statements: Tuple[ASTNode, ...]
+    # Flattened traversal, built on the first walk (see compile_events)
+    _events: Optional[list] = field(default=None, init=False, repr=False, compare=False)
+    # Visitor class -> compiled hook calls (see ASTVisitor._compile_walk)
+    _walks: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
     
     def __repr__(self):
         return f"Program({len(self.statements)} statements)"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Annotation(ASTNode):
     """Decorator/annotation (e.g., @requires_user_consent)"""
     name: str
-    arguments: List[ASTNode] = field(default_factory=list)
+    arguments: Tuple[ASTNode, ...] = ()
     
     def __repr__(self):
         args = f"({', '.join(repr(a) for a in self.arguments)})" if self.arguments else ""
         return f"@{self.name}{args}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FunctionDef(ASTNode):
     """Function definition"""
     name: str
     parameters: List[str]
-    body: List[ASTNode]
-    annotations: List[Annotation] = field(default_factory=list)
+    body: Tuple[ASTNode, ...]
+    annotations: Tuple[Annotation, ...] = ()
     return_type: Optional[str] = None
+    # Derived once at construction so analyzers don't rebuild it per pass
+    annotation_names: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.annotation_names = frozenset(ann.name for ann in self.annotations)
     
     def __repr__(self):
         return f"FunctionDef({self.name}, params={self.parameters})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Assignment(ASTNode):
     """Variable assignment"""
     name: str
@@ -62,7 +162,7 @@ class Assignment(ASTNode):
         return f"Assignment({self.name} = {self.value})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Variable(ASTNode):
     """Variable reference"""
     name: str
@@ -71,9 +171,11 @@ class Variable(ASTNode):
         return f"Var({self.name})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BinaryOp(ASTNode):
     """Binary operation (e.g., a + b, x == y)"""
+    _depth_kind = DEPTH_BINARY
+    
     left: ASTNode
     operator: str
     right: ASTNode
@@ -82,9 +184,11 @@ class BinaryOp(ASTNode):
         return f"BinaryOp({self.left} {self.operator} {self.right})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UnaryOp(ASTNode):
     """Unary operation (e.g., -x, not flag)"""
+    _depth_kind = DEPTH_UNARY
+    
     operator: str
     operand: ASTNode
     
@@ -92,7 +196,7 @@ class UnaryOp(ASTNode):
         return f"UnaryOp({self.operator} {self.operand})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Literal(ASTNode):
     """Literal value (number, string, boolean, none)"""
     value: Any
@@ -102,58 +206,93 @@ class Literal(ASTNode):
         return f"Literal({self.type_name}:{repr(self.value)})"
 
 
-@dataclass
+@dataclass(repr=False, **_SLOTS)
+class StringLiteral(Literal):
+    """String literal"""
+
+
+@dataclass(repr=False, **_SLOTS)
+class NumericLiteral(Literal):
+    """Integer or float literal"""
+
+
+@dataclass(repr=False, **_SLOTS)
+class BoolLiteral(Literal):
+    """Boolean literal"""
+
+
+@dataclass(**_SLOTS)
 class ListLiteral(ASTNode):
     """List literal [1, 2, 3]"""
-    elements: List[ASTNode]
+    _depth_kind = DEPTH_CONTAINER
+    
+    elements: Tuple[ASTNode, ...]
+    # Element values when every element is a literal, so the interpreter
+    # can build the list without visiting each element
+    constant_elements: Optional[tuple] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.constant_elements = None
+        if all(isinstance(elem, Literal) for elem in self.elements):
+            self.constant_elements = tuple(elem.value for elem in self.elements)
     
     def __repr__(self):
         return f"List([{', '.join(repr(e) for e in self.elements)}])"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DictLiteral(ASTNode):
     """Dictionary literal {key: value}"""
-    pairs: List[tuple[ASTNode, ASTNode]]
+    _depth_kind = DEPTH_CONTAINER
+    
+    pairs: Tuple[Tuple[ASTNode, ASTNode], ...]
+    # (key, value) pairs when every key and value is a literal
+    constant_pairs: Optional[tuple] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.constant_pairs = None
+        if all(isinstance(key, Literal) and isinstance(value, Literal)
+               for key, value in self.pairs):
+            self.constant_pairs = tuple((key.value, value.value) for key, value in self.pairs)
     
     def __repr__(self):
         items = ', '.join(f"{repr(k)}: {repr(v)}" for k, v in self.pairs)
         return f"Dict({{{items}}})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class IfStatement(ASTNode):
     """Conditional statement"""
     condition: ASTNode
-    then_body: List[ASTNode]
-    else_body: Optional[List[ASTNode]] = None
+    then_body: Tuple[ASTNode, ...]
+    else_body: Optional[Tuple[ASTNode, ...]] = None
     
     def __repr__(self):
         return f"If({self.condition})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WhileLoop(ASTNode):
     """While loop"""
     condition: ASTNode
-    body: List[ASTNode]
+    body: Tuple[ASTNode, ...]
     
     def __repr__(self):
         return f"While({self.condition})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ForLoop(ASTNode):
     """For loop (iterating over collections)"""
     variable: str
     iterable: ASTNode
-    body: List[ASTNode]
+    body: Tuple[ASTNode, ...]
     
     def __repr__(self):
         return f"For({self.variable} in {self.iterable})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ReturnStatement(ASTNode):
     """Return statement"""
     value: Optional[ASTNode] = None
@@ -162,20 +301,31 @@ class ReturnStatement(ASTNode):
         return f"Return({self.value if self.value else 'void'})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FunctionCall(ASTNode):
     """Function call"""
+    _depth_kind = DEPTH_CALL
+    
     function: ASTNode  # Usually a Variable, but could be complex expression
-    arguments: List[ASTNode]
+    arguments: Tuple[ASTNode, ...]
+    # Derived once at construction so analyzers don't re-inspect the callee
+    callee_name: Optional[str] = field(init=False, repr=False, compare=False)
+    arg_count: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.callee_name = self.function.name if isinstance(self.function, Variable) else None
+        self.arg_count = len(self.arguments)
     
     def __repr__(self):
         args = ', '.join(repr(a) for a in self.arguments)
         return f"Call({self.function}({args}))"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MemberAccess(ASTNode):
     """Member access (e.g., obj.field)"""
+    _depth_kind = DEPTH_ACCESS
+    
     object: ASTNode
     member: str
     
@@ -183,9 +333,11 @@ class MemberAccess(ASTNode):
         return f"MemberAccess({self.object}.{self.member})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class IndexAccess(ASTNode):
     """Index access (e.g., list[0])"""
+    _depth_kind = DEPTH_ACCESS
+    
     object: ASTNode
     index: ASTNode
     
@@ -193,90 +345,216 @@ class IndexAccess(ASTNode):
         return f"IndexAccess({self.object}[{self.index}])"
 
 
+# Events in a flattened traversal (see compile_events)
+_ENTER = 0
+_EXIT = 1
+_ENTER_BLOCK = 2
+_EXIT_BLOCK = 3
+
+
+def compile_events(root: ASTNode) -> List[tuple]:
+    """
+    Flatten a tree into the linear sequence of traversal events
+    
+    Each entry is (event, node, field): entering and leaving every node in
+    source order, plus entering/leaving each nested statement block (bodies
+    of functions, branches, loops). Analyses replay this list instead of
+    re-walking the tree, and a Program caches its list so that every
+    analyzer run over it shares one flattening.
+    """
+    events = []
+    emit = events.append
+    stack = [(_ENTER, root, None)]
+    push = stack.append
+    pop = stack.pop
+    
+    while stack:
+        entry = pop()
+        emit(entry)
+        event, node, _ = entry
+        if event != _ENTER:
+            continue
+        
+        push((_EXIT, node, None))
+        for name, kind in reversed(node._child_fields):
+            value = getattr(node, name)
+            if value is None:
+                continue
+            if kind == CHILD_NODE:
+                push((_ENTER, value, None))
+            elif kind == CHILD_PAIRS:
+                for key, item in reversed(value):
+                    push((_ENTER, item, None))
+                    push((_ENTER, key, None))
+            else:
+                if kind == CHILD_BLOCK:
+                    push((_EXIT_BLOCK, node, name))
+                for child in reversed(value):
+                    push((_ENTER, child, None))
+                if kind == CHILD_BLOCK:
+                    push((_ENTER_BLOCK, node, name))
+    
+    return events
+
+
+def get_events(root: ASTNode) -> List[tuple]:
+    """Return the flattened traversal of a tree, cached on Program roots"""
+    if isinstance(root, Program):
+        events = root._events
+        if events is None:
+            events = root._events = compile_events(root)
+        return events
+    return compile_events(root)
+
+
+def iter_children(node: ASTNode):
+    """Yield the direct child nodes of a node in source order"""
+    for name, kind in node._child_fields:
+        value = getattr(node, name)
+        if value is None:
+            continue
+        if kind == CHILD_NODE:
+            yield value
+        elif kind == CHILD_PAIRS:
+            for key, item in value:
+                yield key
+                yield item
+        else:
+            yield from value
+
+
 # Visitor pattern for AST traversal
-class ASTVisitor(ABC):
+class ASTVisitor:
     """
     Base class for AST visitors
     Implements the visitor pattern for tree traversal
+    
+    Two traversal styles are supported:
+    - visit(): recursive dispatch to visit_X methods, which may return values
+    - walk(): iterative traversal calling enter_X/exit_X hooks, for
+      analyzers that only accumulate state
     """
     
+    # Optional hooks fired by walk() around nested statement blocks
+    enter_block = None
+    exit_block = None
+    
+    # Set by a hook to stop walk() early, e.g. once a budget is exhausted
+    _aborted = False
+    
+    # Dispatch tables shared by every instance of a visitor class, filled on
+    # first sight of each node class. They hold plain functions, called
+    # with the visitor as first argument.
+    _visitors = {}      # node class -> visit function
+    _hook_table = {}    # node class -> (enter hook, exit hook) for walk()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._visitors = {}
+        cls._hook_table = {}
+    
+    def walk(self, root: ASTNode):
+        """
+        Traverse the tree without recursion
+        
+        On entering a node enter_X(node) is called, and exit_X(node) runs
+        once all its children are done. Blocks (bodies of functions,
+        branches, loops) additionally fire enter_block(node, field) /
+        exit_block(node, field) when the visitor defines them. The walk
+        stops as soon as a hook sets self._aborted.
+        
+        The traversal is first compiled into the flat list of hook calls
+        it makes (see _compile_walk), which is then run in one loop.
+        """
+        for hook, node, field_name in self._compile_walk(root):
+            if self._aborted:
+                break
+            if field_name is None:
+                hook(self, node)
+            else:
+                hook(self, node, field_name)
+    
+    def _compile_walk(self, root: ASTNode) -> List[tuple]:
+        """
+        Resolve a traversal into the (hook, node, field) calls it makes
+        
+        Hooks are shared by every instance of a visitor class, so for
+        Program roots the compiled list is cached per class and repeated
+        analyses of the same program skip dispatch entirely.
+        """
+        if not isinstance(root, Program):
+            return self._resolve_calls(root)
+        
+        cache = root._walks
+        if cache is None:
+            cache = root._walks = {}
+        calls = cache.get(type(self))
+        if calls is None:
+            calls = cache[type(self)] = self._resolve_calls(root)
+        return calls
+    
+    def _resolve_calls(self, root: ASTNode) -> List[tuple]:
+        """
+        Map each traversal event to the hook it triggers
+        
+        Events with no hook are dropped, so nodes a visitor doesn't handle
+        cost nothing when the list is run.
+        """
+        hooks = self._hook_table
+        block_hooks = self._block_hook_functions()
+        calls = []
+        append = calls.append
+        
+        for event, node, field_name in get_events(root):
+            if event == _ENTER or event == _EXIT:
+                try:
+                    hook = hooks[node.__class__][event]
+                except KeyError:
+                    hook = self._resolve_hooks(node.__class__)[event]
+                if hook is not None:
+                    append((hook, node, None))
+            else:
+                hook = block_hooks[event - _ENTER_BLOCK]
+                if hook is not None:
+                    append((hook, node, field_name))
+        
+        return calls
+    
+    def _block_hook_functions(self) -> tuple:
+        """Return the (enter_block, exit_block) functions, or None for each"""
+        owner = type(self)
+        return (owner.enter_block, owner.exit_block)
+    
+    def _resolve_hooks(self, cls: type) -> tuple:
+        """Look up and cache the enter/exit hook functions for a node class"""
+        owner = type(self)
+        hooks = (
+            self._find_method(owner, cls._enter_names),
+            self._find_method(owner, cls._exit_names),
+        )
+        self._hook_table[cls] = hooks
+        return hooks
+    
+    @staticmethod
+    def _find_method(owner, names: tuple):
+        """Return the first of the named attributes owner defines, or None"""
+        for name in names:
+            method = getattr(owner, name, None)
+            if method is not None:
+                return method
+        return None
+    
     def visit(self, node: ASTNode):
         """Dispatch to appropriate visit method"""
-        method_name = f'visit_{node.__class__.__name__}'
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        try:
+            visitor = self._visitors[node.__class__]
+        except KeyError:
+            owner = type(self)
+            visitor = self._find_method(owner, node._visit_names) or owner.generic_visit
+            self._visitors[node.__class__] = visitor
+        return visitor(self, node)
     
     def generic_visit(self, node: ASTNode):
-        """Default visit method"""
-        raise NotImplementedError(f"No visit method for {node.__class__.__name__}")
-    
-    def visit_Program(self, node: Program):
-        for stmt in node.statements:
-            self.visit(stmt)
-    
-    def visit_FunctionDef(self, node: FunctionDef):
-        for stmt in node.body:
-            self.visit(stmt)
-    
-    def visit_Assignment(self, node: Assignment):
-        self.visit(node.value)
-    
-    def visit_Variable(self, node: Variable):
-        pass
-    
-    def visit_BinaryOp(self, node: BinaryOp):
-        self.visit(node.left)
-        self.visit(node.right)
-    
-    def visit_UnaryOp(self, node: UnaryOp):
-        self.visit(node.operand)
-    
-    def visit_Literal(self, node: Literal):
-        pass
-    
-    def visit_ListLiteral(self, node: ListLiteral):
-        for elem in node.elements:
-            self.visit(elem)
-    
-    def visit_DictLiteral(self, node: DictLiteral):
-        for key, value in node.pairs:
-            self.visit(key)
-            self.visit(value)
-    
-    def visit_IfStatement(self, node: IfStatement):
-        self.visit(node.condition)
-        for stmt in node.then_body:
-            self.visit(stmt)
-        if node.else_body:
-            for stmt in node.else_body:
-                self.visit(stmt)
-    
-    def visit_WhileLoop(self, node: WhileLoop):
-        self.visit(node.condition)
-        for stmt in node.body:
-            self.visit(stmt)
-    
-    def visit_ForLoop(self, node: ForLoop):
-        self.visit(node.iterable)
-        for stmt in node.body:
-            self.visit(stmt)
-    
-    def visit_ReturnStatement(self, node: ReturnStatement):
-        if node.value:
-            self.visit(node.value)
-    
-    def visit_FunctionCall(self, node: FunctionCall):
-        self.visit(node.function)
-        for arg in node.arguments:
-            self.visit(arg)
-    
-    def visit_MemberAccess(self, node: MemberAccess):
-        self.visit(node.object)
-    
-    def visit_IndexAccess(self, node: IndexAccess):
-        self.visit(node.object)
-        self.visit(node.index)
-    
-    def visit_Annotation(self, node: Annotation):
-        for arg in node.arguments:
-            self.visit(arg)
+        """Default visit method: visit every child node"""
+        for child in iter_children(node):
+            self.visit(child)
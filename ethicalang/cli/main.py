@@ -11,11 +11,7 @@ from typing import Optional
 
 from ..lexer.lexer import Lexer
 from ..parser.parser import Parser
-from ..analysis.energy import EnergyAnalyzer
-from ..analysis.ethics import EthicsChecker, format_ethics_report
-from ..analysis.readability import ReadabilityScorer, format_readability_report
-from ..analysis.cleverness import ClevernessDetector, format_cleverness_report
-from ..runtime.interpreter import Interpreter
+from ..analysis.combined import CombinedAnalyzer
 
 
 class Colors:
@@ -31,31 +27,159 @@ class Colors:
     RESET = '\033[0m'
 
 
+def _is_terminal(stream) -> bool:
+    """Check whether a stream is an interactive terminal"""
+    isatty = getattr(stream, 'isatty', None)
+    return bool(isatty and isatty())
+
+
+def _styled(text: str, style: str, colored: bool) -> str:
+    """Wrap text in a color style, or leave it plain"""
+    return f"{style}{text}{Colors.RESET}" if colored else text
+
+
+# Pipes and files get plain text rather than escape sequences. Errors go to
+# stderr, so they follow its terminal state; everything else uses stdout's.
+_STDOUT_COLORED = _is_terminal(sys.stdout)
+_STDERR_COLORED = _is_terminal(sys.stderr)
+
+# Message decorations, built once rather than on every print
+_ERROR_PREFIX = _styled("❌ Error:", Colors.RED, _STDERR_COLORED) + " "
+_SUCCESS_PREFIX = _styled("✓", Colors.GREEN, _STDOUT_COLORED) + " "
+_WARNING_PREFIX = _styled("⚠", Colors.YELLOW, _STDOUT_COLORED) + " "
+_INFO_PREFIX = _styled("ℹ", Colors.CYAN, _STDOUT_COLORED) + " "
+_SECTION_STYLE = f"{Colors.BOLD}{Colors.CYAN}"
+_SECTION_BAR = _styled('=' * 60, _SECTION_STYLE, _STDOUT_COLORED)
+
+
 def print_error(message: str):
     """Print an error message"""
-    print(f"{Colors.RED}❌ Error:{Colors.RESET} {message}", file=sys.stderr)
+    print(_ERROR_PREFIX + message, file=sys.stderr)
 
 
 def print_success(message: str):
     """Print a success message"""
-    print(f"{Colors.GREEN}✓{Colors.RESET} {message}")
+    print(_SUCCESS_PREFIX + message)
 
 
 def print_warning(message: str):
     """Print a warning message"""
-    print(f"{Colors.YELLOW}⚠{Colors.RESET} {message}")
+    print(_WARNING_PREFIX + message)
 
 
 def print_info(message: str):
     """Print an info message"""
-    print(f"{Colors.CYAN}ℹ{Colors.RESET} {message}")
+    print(_INFO_PREFIX + message)
 
 
 def print_section(title: str):
     """Print a section header"""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'=' * 60}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{title}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'=' * 60}{Colors.RESET}\n")
+    title = _styled(title, _SECTION_STYLE, _STDOUT_COLORED)
+    print(f"\n{_SECTION_BAR}\n{title}\n{_SECTION_BAR}\n")
+
+
+def print_heading(title: str):
+    """Print a report heading"""
+    print("\n" + _styled(title, Colors.BOLD, _STDOUT_COLORED))
+
+
+def report_energy(energy_results: dict, config: dict, errors: list):
+    """Print the energy analysis results, recording a failure in errors"""
+    if config.get('verbose') or not energy_results['within_budget']:
+        print_heading("Energy Efficiency Analysis:")
+        print(f"  Total Cost: {energy_results['total_cost']} units")
+        print(f"  Budget: {energy_results['budget']} units")
+        if energy_results['within_budget']:
+            print_success("Energy budget satisfied")
+        else:
+            print_error(f"Energy budget exceeded by {energy_results['total_cost'] - energy_results['budget']} units")
+            for violation in energy_results['violations']:
+                print(f"    • {violation['message']}")
+            errors.append("Energy budget exceeded")
+
+
+def report_ethics(ethics_results: dict, config: dict, errors: list):
+    """Print the ethics check results, recording a failure in errors"""
+    if config.get('verbose') or not ethics_results['passed']:
+        print_heading("Ethics Check:")
+        if ethics_results['passed']:
+            print_success("No ethical violations detected")
+        else:
+            print_error("Ethical violations detected:")
+            for violation in ethics_results['violations']:
+                print(f"    • {violation['message']}")
+            errors.append("Ethics check failed")
+
+
+def report_readability(readability_results: dict, config: dict, errors: list):
+    """Print the readability analysis results, recording a failure in errors"""
+    min_score = readability_results['min_score']
+    
+    if config.get('verbose') or not readability_results['passed']:
+        print_heading("Readability Analysis:")
+        score = readability_results['overall_score']
+        print(f"  Overall Score: {score}/100")
+        
+        if readability_results['passed']:
+            print_success(f"Readability score meets threshold ({min_score})")
+        else:
+            print_error(f"Readability score below threshold (minimum: {min_score})")
+            for issue in readability_results['issues']:
+                if issue['type'] != 'low_readability':
+                    print(f"    • {issue['message']}")
+            errors.append("Readability check failed")
+
+
+def report_cleverness(cleverness_results: dict, config: dict, errors: list):
+    """Print the cleverness detection results, recording a failure in errors"""
+    if config.get('verbose') or not cleverness_results['passed']:
+        print_heading("Cleverness Detection:")
+        if cleverness_results['passed']:
+            print_success("Code is appropriately clear")
+        else:
+            print_error("Overly clever code detected:")
+            for violation in cleverness_results['violations']:
+                print(f"    • {violation['message']}")
+                if violation.get('suggestion'):
+                    print(f"      💡 {violation['suggestion']}")
+            errors.append("Cleverness check failed")
+
+
+def create_energy_analyzer(config: dict):
+    """Create the energy analyzer for a configuration"""
+    from ..analysis.energy import EnergyAnalyzer
+    return EnergyAnalyzer(budget=config.get('energy_budget', 1000))
+
+
+def create_ethics_checker(config: dict):
+    """Create the ethics checker for a configuration"""
+    from ..analysis.ethics import EthicsChecker
+    return EthicsChecker(strict_mode=config.get('strict_ethics', True))
+
+
+def create_readability_scorer(config: dict):
+    """Create the readability scorer for a configuration"""
+    from ..analysis.readability import ReadabilityScorer
+    return ReadabilityScorer(min_score=config.get('min_readability', 70))
+
+
+def create_cleverness_detector(config: dict):
+    """Create the cleverness detector for a configuration"""
+    from ..analysis.cleverness import ClevernessDetector
+    return ClevernessDetector(strict_mode=config.get('strict_cleverness', True))
+
+
+# Static analysis stages, in report order:
+# (config flag, result name, analyzer factory, failure label, reporter).
+# The factories import their analyzer on use, so disabled checks never load.
+ANALYSIS_STAGES = (
+    ('check_energy', 'energy', create_energy_analyzer, "Energy analysis", report_energy),
+    ('check_ethics', 'ethics', create_ethics_checker, "Ethics check", report_ethics),
+    ('check_readability', 'readability', create_readability_scorer,
+     "Readability analysis", report_readability),
+    ('check_cleverness', 'cleverness', create_cleverness_detector,
+     "Cleverness detection", report_cleverness),
+)
 
 
 def compile_program(source_code: str, config: dict) -> tuple[Optional[any], list]:
@@ -70,10 +194,11 @@ def compile_program(source_code: str, config: dict) -> tuple[Optional[any], list
         Tuple of (AST, errors list)
     """
     errors = []
+    verbose = config.get('verbose')
     
     try:
         # Stage 1: Lexical Analysis
-        if config.get('verbose'):
+        if verbose:
             print_section("Stage 1: Lexical Analysis")
         
         lexer = Lexer(source_code)
@@ -84,7 +209,7 @@ def compile_program(source_code: str, config: dict) -> tuple[Optional[any], list
             for token in tokens:
                 print(f"  {token}")
         
-        if config.get('verbose'):
+        if verbose:
             print_success(f"Lexical analysis complete: {len(tokens)} tokens")
         
     except Exception as e:
@@ -93,7 +218,7 @@ def compile_program(source_code: str, config: dict) -> tuple[Optional[any], list
     
     try:
         # Stage 2: Parsing
-        if config.get('verbose'):
+        if verbose:
             print_section("Stage 2: Parsing")
         
         parser = Parser(tokens)
@@ -103,114 +228,62 @@ def compile_program(source_code: str, config: dict) -> tuple[Optional[any], list
             print("Abstract Syntax Tree:")
             print(f"  {ast}")
         
-        if config.get('verbose'):
+        if verbose:
             print_success("Parsing complete")
         
     except Exception as e:
         print_error(f"Parsing failed: {e}")
         return None, [str(e)]
     
+    # The token stream isn't needed past parsing; release it (the lexer
+    # and parser both hold it) so it isn't resident during analysis
+    del lexer, parser, tokens
+    
     # Stage 3: Static Analysis
-    if config.get('verbose'):
+    if verbose:
         print_section("Stage 3: Static Analysis")
     
-    # Energy Analysis
-    if config.get('check_energy', True):
+    # All enabled analyses share a single pass over the AST. Each stage
+    # fails on its own: an analyzer that can't be built or raises during
+    # the pass is reported once, and the other stages still report.
+    stages = [stage for stage in ANALYSIS_STAGES if config.get(stage[0], True)]
+    analyzers = {}
+    failures = {}
+    for _, name, create, _, _ in stages:
         try:
-            energy_budget = config.get('energy_budget', 1000)
-            energy_analyzer = EnergyAnalyzer(budget=energy_budget)
-            energy_results = energy_analyzer.analyze(ast)
-            
-            if config.get('verbose') or not energy_results['within_budget']:
-                print(f"\n{Colors.BOLD}Energy Efficiency Analysis:{Colors.RESET}")
-                print(f"  Total Cost: {energy_results['total_cost']} units")
-                print(f"  Budget: {energy_results['budget']} units")
-                if energy_results['within_budget']:
-                    print_success("Energy budget satisfied")
-                else:
-                    print_error(f"Energy budget exceeded by {energy_results['total_cost'] - energy_results['budget']} units")
-                    for violation in energy_results['violations']:
-                        print(f"    • {violation['message']}")
-                    errors.append("Energy budget exceeded")
-        
+            analyzers[name] = create(config)
         except Exception as e:
-            print_error(f"Energy analysis failed: {e}")
-            errors.append(str(e))
+            failures[name] = e
     
-    # Ethics Check
-    if config.get('check_ethics', True):
+    # With every check disabled (or failed to build) there is nothing to
+    # walk, so the tree isn't flattened at all
+    combined_results = {}
+    if analyzers:
+        combined = CombinedAnalyzer(analyzers)
         try:
-            ethics_checker = EthicsChecker(strict_mode=config.get('strict_ethics', True))
-            ethics_results = ethics_checker.analyze(ast)
-            
-            if config.get('verbose') or not ethics_results['passed']:
-                print(f"\n{Colors.BOLD}Ethics Check:{Colors.RESET}")
-                if ethics_results['passed']:
-                    print_success("No ethical violations detected")
-                else:
-                    print_error("Ethical violations detected:")
-                    for violation in ethics_results['violations']:
-                        print(f"    • {violation['message']}")
-                    errors.append("Ethics check failed")
-        
+            combined_results = combined.analyze(ast)
+            failures.update(combined.errors)
         except Exception as e:
-            print_error(f"Ethics check failed: {e}")
-            errors.append(str(e))
+            # The shared walk itself failed, so no analyzer has results
+            failures.update(dict.fromkeys(analyzers, e))
     
-    # Readability Scoring
-    if config.get('check_readability', True):
+    for _, name, _, label, report in stages:
         try:
-            min_score = config.get('min_readability', 70)
-            readability_scorer = ReadabilityScorer(min_score=min_score)
-            readability_results = readability_scorer.analyze(ast)
-            
-            if config.get('verbose') or not readability_results['passed']:
-                print(f"\n{Colors.BOLD}Readability Analysis:{Colors.RESET}")
-                score = readability_results['overall_score']
-                print(f"  Overall Score: {score}/100")
-                
-                if readability_results['passed']:
-                    print_success(f"Readability score meets threshold ({min_score})")
-                else:
-                    print_error(f"Readability score below threshold (minimum: {min_score})")
-                    for issue in readability_results['issues']:
-                        if issue['type'] != 'low_readability':
-                            print(f"    • {issue['message']}")
-                    errors.append("Readability check failed")
+            if name in failures:
+                raise failures[name]
+            report(combined_results[name], config, errors)
         
         except Exception as e:
-            print_error(f"Readability analysis failed: {e}")
-            errors.append(str(e))
-    
-    # Cleverness Detection
-    if config.get('check_cleverness', True):
-        try:
-            cleverness_detector = ClevernessDetector(strict_mode=config.get('strict_cleverness', True))
-            cleverness_results = cleverness_detector.analyze(ast)
-            
-            if config.get('verbose') or not cleverness_results['passed']:
-                print(f"\n{Colors.BOLD}Cleverness Detection:{Colors.RESET}")
-                if cleverness_results['passed']:
-                    print_success("Code is appropriately clear")
-                else:
-                    print_error("Overly clever code detected:")
-                    for violation in cleverness_results['violations']:
-                        print(f"    • {violation['message']}")
-                        if violation.get('suggestion'):
-                            print(f"      💡 {violation['suggestion']}")
-                    errors.append("Cleverness check failed")
-        
-        except Exception as e:
-            print_error(f"Cleverness detection failed: {e}")
+            print_error(f"{label} failed: {e}")
             errors.append(str(e))
     
     if errors:
-        if config.get('verbose'):
+        if verbose:
             print_section("Compilation Result")
         print_error(f"Compilation failed with {len(errors)} error(s)")
         return None, errors
     
-    if config.get('verbose'):
+    if verbose:
         print_section("Compilation Result")
         print_success("All static analysis checks passed!")
     
@@ -225,14 +298,18 @@ def run_program(ast, config: dict):
         ast: Compiled AST
         config: Configuration dictionary
     """
+    verbose = config.get('verbose')
+    
     try:
-        if config.get('verbose'):
+        if verbose:
             print_section("Stage 4: Execution")
         
+        # Imported here so that `check` never loads the runtime
+        from ..runtime.interpreter import Interpreter
         interpreter = Interpreter()
         result = interpreter.execute(ast)
         
-        if config.get('verbose'):
+        if verbose:
             print_section("Execution Complete")
             if result is not None:
                 print(f"Program returned: {result}")
@@ -5,9 +5,11 @@ Converts source code text into a stream of tokens for parsing.
 Implements a hand-written scanner with lookahead capabilities.
 """
 
+import re
+import sys
 from enum import Enum, auto
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, NoReturn, Optional
 
 
 class TokenType(Enum):
@@ -72,13 +74,21 @@ class TokenType(Enum):
     INDENT = auto()
     DEDENT = auto()
     EOF = auto()
+    
+    # Members are singletons compared by identity, so hash them by identity
+    # too; Enum's default hashes the name in Python on every dict lookup
+    __hash__ = object.__hash__
 
 
 @dataclass
 class Token:
     """Represents a single token in the source code"""
+    # Declared by hand rather than with dataclass(slots=True), which needs
+    # Python 3.10; the fields have no defaults, so the two don't clash
+    __slots__ = ('type', 'value', 'line', 'column')
+    
     type: TokenType
-    value: any
+    value: Any
     line: int
     column: int
     
@@ -86,6 +96,16 @@ class Token:
         return f"Token({self.type.name}, {repr(self.value)}, {self.line}:{self.column})"
 
 
+# Token types the lexer emits per token, bound once at import: on CPython
+# 3.11 every TokenType.X lookup goes through EnumType.__getattr__
+_IDENTIFIER = TokenType.IDENTIFIER
+_INTEGER = TokenType.INTEGER
+_FLOAT = TokenType.FLOAT
+_STRING = TokenType.STRING
+_NEWLINE = TokenType.NEWLINE
+_DOT = TokenType.DOT
+
+
 class Lexer:
     """
     Lexical analyzer for EthicaLang
@@ -112,6 +132,58 @@ class Lexer:
         'none': TokenType.NONE,
     }
     
+    # Token values of the literal keywords; other keywords carry their text
+    KEYWORD_VALUES = {
+        'true': True,
+        'false': False,
+        'none': None,
+    }
+    
+    # Operators and delimiters are looked up by their first character
+    SINGLE_CHAR_TOKENS = {
+        '+': TokenType.PLUS,
+        '/': TokenType.DIVIDE,
+        '%': TokenType.MODULO,
+        '(': TokenType.LPAREN,
+        ')': TokenType.RPAREN,
+        '{': TokenType.LBRACE,
+        '}': TokenType.RBRACE,
+        '[': TokenType.LBRACKET,
+        ']': TokenType.RBRACKET,
+        ',': TokenType.COMMA,
+        ':': TokenType.COLON,
+        '@': TokenType.AT,
+    }
+    
+    # first char -> (two-char text, two-char token, one-char token or None);
+    # the text is shared by every token of that kind. One-character values
+    # are taken from the source, and CPython caches those strings
+    PAIRED_TOKENS = {
+        '-': ('->', TokenType.ARROW, TokenType.MINUS),
+        '*': ('**', TokenType.POWER, TokenType.MULTIPLY),
+        '=': ('==', TokenType.EQ, TokenType.ASSIGN),
+        '!': ('!=', TokenType.NE, None),
+        '<': ('<=', TokenType.LE, TokenType.LT),
+        '>': ('>=', TokenType.GE, TokenType.GT),
+    }
+    
+    # Runs of identifier characters, digits and whitespace are matched in
+    # one call; only _SPACE_RE and _LINE_START_RE can span a newline.
+    # _LINE_START_RE takes a line's indent, plus the comment and line
+    # break when the line holds no code
+    _IDENT_RE = re.compile(r'\w+')
+    _NUMBER_RE = re.compile(r'\d+(?:\.\d*)?')
+    _HSPACE_RE = re.compile(r'[ \t]+')
+    _LINE_START_RE = re.compile(r'([ \t]*)(#[^\n]*)?(\r\n|\r|\n)?')
+    _SPACE_RE = re.compile(r'[ \t\r\n]+')
+    
+    # Escape sequences in string literals; any other escaped character
+    # (including \\ and the quote) stands for itself
+    ESCAPES = {
+        'n': '\n',
+        't': '\t',
+    }
+    
     def __init__(self, source: str):
         """Initialize lexer with source code"""
         self.source = source
@@ -119,9 +191,9 @@ class Lexer:
         self.line = 1
         self.column = 1
         self.tokens: List[Token] = []
-        self.indent_stack = [0]  # Track indentation levels
+        self.indent_stack: List[int] = [0]  # Track indentation levels
         
-    def error(self, message: str):
+    def error(self, message: str) -> NoReturn:
         """Raise a lexer error with position information"""
         raise SyntaxError(f"Lexer error at line {self.line}, column {self.column}: {message}")
     
@@ -153,110 +225,120 @@ class Lexer:
             
         return char
     
+    def advance_to(self, end: int):
+        """Move to position end in one step, keeping line/column in sync"""
+        newlines = self.source.count('\n', self.pos, end)
+        if newlines:
+            self.line += newlines
+            self.column = end - self.source.rindex('\n', self.pos, end)
+        else:
+            self.column += end - self.pos
+        self.pos = end
+    
     def skip_whitespace(self, skip_newlines: bool = True):
         """Skip whitespace characters"""
-        while self.current_char() and self.current_char() in ' \t':
-            self.advance()
+        match = self._HSPACE_RE.match(self.source, self.pos)
+        if match:
+            self.column += match.end() - self.pos
+            self.pos = match.end()
         
         if skip_newlines:
-            while self.current_char() and self.current_char() in '\r\n':
-                self.advance()
-                self.skip_whitespace(skip_newlines=False)
+            match = self._SPACE_RE.match(self.source, self.pos)
+            if match:
+                self.advance_to(match.end())
     
     def skip_comment(self):
         """Skip single-line comments starting with #"""
         if self.current_char() == '#':
-            while self.current_char() and self.current_char() != '\n':
-                self.advance()
+            end = self.source.find('\n', self.pos)
+            if end == -1:
+                end = len(self.source)
+            self.column += end - self.pos
+            self.pos = end
     
     def read_string(self) -> str:
         """Read a string literal"""
         quote_char = self.current_char()
         self.advance()  # Skip opening quote
         
-        value = ""
-        while self.current_char() and self.current_char() != quote_char:
-            if self.current_char() == '\\':
-                self.advance()
-                escape_char = self.current_char()
-                if escape_char == 'n':
-                    value += '\n'
-                elif escape_char == 't':
-                    value += '\t'
-                elif escape_char == '\\':
-                    value += '\\'
-                elif escape_char == quote_char:
-                    value += quote_char
-                else:
-                    value += escape_char
-                self.advance()
-            else:
-                value += self.current_char()
-                self.advance()
+        # Jump from escape to escape with str.find; the unescaped runs
+        # between them are sliced out of the source whole
+        source = self.source
+        length = len(source)
+        parts = []
+        pos = self.pos
+        while True:
+            end = source.find(quote_char, pos)
+            if end == -1:
+                end = length
+            backslash = source.find('\\', pos, end)
+            if backslash == -1:
+                parts.append(source[pos:end])
+                pos = end
+                break
+            parts.append(source[pos:backslash])
+            if backslash + 1 >= length:
+                pos = length
+                break
+            escape_char = source[backslash + 1]
+            parts.append(self.ESCAPES.get(escape_char, escape_char))
+            pos = backslash + 2
+        self.advance_to(pos)
         
-        if self.current_char() != quote_char:
+        # The scan stops only on the closing quote or at end of input
+        if pos >= length:
             self.error(f"Unterminated string literal")
         
         self.advance()  # Skip closing quote
-        return value
+        return "".join(parts)
     
     def read_number(self) -> Token:
         """Read a numeric literal (integer or float)"""
         start_line = self.line
         start_col = self.column
         
-        num_str = ""
-        has_dot = False
-        
-        while self.current_char() and (self.current_char().isdigit() or self.current_char() == '.'):
-            if self.current_char() == '.':
-                if has_dot:
-                    break
-                has_dot = True
-            num_str += self.current_char()
-            self.advance()
+        num_str = self._NUMBER_RE.match(self.source, self.pos).group()
+        self.pos += len(num_str)
+        self.column += len(num_str)
         
-        if has_dot:
-            return Token(TokenType.FLOAT, float(num_str), start_line, start_col)
+        if '.' in num_str:
+            return Token(_FLOAT, float(num_str), start_line, start_col)
         else:
-            return Token(TokenType.INTEGER, int(num_str), start_line, start_col)
+            return Token(_INTEGER, int(num_str), start_line, start_col)
     
     def read_identifier(self) -> Token:
         """Read an identifier or keyword"""
         start_line = self.line
         start_col = self.column
         
-        ident = ""
-        while self.current_char() and (self.current_char().isalnum() or self.current_char() == '_'):
-            ident += self.current_char()
-            self.advance()
+        # Interned so every occurrence of a name shares one string
+        ident = sys.intern(self._IDENT_RE.match(self.source, self.pos).group())
+        self.pos += len(ident)
+        self.column += len(ident)
         
         # Check if it's a keyword
-        token_type = self.KEYWORDS.get(ident, TokenType.IDENTIFIER)
+        token_type = self.KEYWORDS.get(ident)
+        if token_type is None:
+            return Token(_IDENTIFIER, ident, start_line, start_col)
         
-        # Set value based on token type
-        if token_type in (TokenType.TRUE, TokenType.FALSE):
-            value = (token_type == TokenType.TRUE)
-        elif token_type == TokenType.NONE:
-            value = None
-        else:
-            value = ident
-        
-        return Token(token_type, value, start_line, start_col)
+        return Token(token_type, self.KEYWORD_VALUES.get(ident, ident), start_line, start_col)
     
     def handle_indentation(self, indent_level: int):
         """Generate INDENT/DEDENT tokens based on indentation changes"""
-        current_indent = self.indent_stack[-1]
+        stack = self.indent_stack
+        current_indent = stack[-1]
         
         if indent_level > current_indent:
-            self.indent_stack.append(indent_level)
+            stack.append(indent_level)
             self.tokens.append(Token(TokenType.INDENT, None, self.line, 1))
         elif indent_level < current_indent:
-            while self.indent_stack and self.indent_stack[-1] > indent_level:
-                self.indent_stack.pop()
-                self.tokens.append(Token(TokenType.DEDENT, None, self.line, 1))
+            append = self.tokens.append
+            line = self.line
+            while stack and stack[-1] > indent_level:
+                stack.pop()
+                append(Token(TokenType.DEDENT, None, line, 1))
             
-            if not self.indent_stack or self.indent_stack[-1] != indent_level:
+            if not stack or stack[-1] != indent_level:
                 self.error(f"Inconsistent indentation")
     
     def tokenize(self) -> List[Token]:
@@ -266,171 +348,95 @@ class Lexer:
         Returns:
             List of tokens including INDENT/DEDENT tokens for Python-like syntax
         """
+        # The loop reads the current character straight from the source
+        # once per iteration; '' stands for end of input
+        source = self.source
+        length = len(source)
+        append = self.tokens.append
         at_line_start = True
         
-        while self.pos < len(self.source):
+        while self.pos < length:
             # Handle indentation at start of line
             if at_line_start:
-                indent_level = 0
-                while self.current_char() in ' \t':
-                    if self.current_char() == ' ':
-                        indent_level += 1
-                    else:  # tab
-                        indent_level += 4
-                    self.advance()
+                match = self._LINE_START_RE.match(source, self.pos)
+                indent, comment, line_break = match.groups()
                 
                 # Skip blank lines and comments
-                if self.current_char() in '\r\n' or self.current_char() == '#':
-                    self.skip_comment()
-                    if self.current_char() in '\r\n':
-                        self.advance()
+                if comment is not None or line_break is not None or match.end() == length:
+                    self.advance_to(match.end())
                     continue
                 
-                # Handle indentation changes
-                if self.current_char() is not None:
-                    self.handle_indentation(indent_level)
-                    at_line_start = False
-                continue
+                indent_level = indent.count(' ') + 4 * indent.count('\t')  # tab = 4
+                self.pos += len(indent)
+                self.column += len(indent)
+                
+                # Handle indentation changes, then go straight on to the
+                # line's first token
+                self.handle_indentation(indent_level)
+                at_line_start = False
+            
+            char = source[self.pos]
             
             # Skip whitespace (but not newlines)
-            if self.current_char() in ' \t':
+            if char in ' \t':
                 self.skip_whitespace(skip_newlines=False)
                 continue
             
             # Skip comments
-            if self.current_char() == '#':
+            if char == '#':
                 self.skip_comment()
                 continue
             
             # Handle newlines
-            if self.current_char() in '\r\n':
+            if char in '\r\n':
                 start_line = self.line
                 start_col = self.column
                 self.advance()
-                self.tokens.append(Token(TokenType.NEWLINE, '\n', start_line, start_col))
+                append(Token(_NEWLINE, '\n', start_line, start_col))
                 at_line_start = True
                 continue
             
             start_line = self.line
             start_col = self.column
-            char = self.current_char()
             
             # String literals
             if char in '"\'':
                 value = self.read_string()
-                self.tokens.append(Token(TokenType.STRING, value, start_line, start_col))
+                append(Token(_STRING, value, start_line, start_col))
             
-            # Numbers
-            elif char.isdigit():
-                self.tokens.append(self.read_number())
+            # Numbers; isdecimal() is exactly what _NUMBER_RE's \d accepts
+            # (isdigit() also admits characters such as '²')
+            elif char.isdecimal():
+                append(self.read_number())
             
             # Identifiers and keywords
             elif char.isalpha() or char == '_':
-                self.tokens.append(self.read_identifier())
+                append(self.read_identifier())
             
-            # Operators and delimiters
-            elif char == '+':
+            # Single-character operators and delimiters
+            elif char in self.SINGLE_CHAR_TOKENS:
                 self.advance()
-                self.tokens.append(Token(TokenType.PLUS, '+', start_line, start_col))
+                append(Token(self.SINGLE_CHAR_TOKENS[char], char, start_line, start_col))
             
-            elif char == '-':
-                self.advance()
-                if self.current_char() == '>':
-                    self.advance()
-                    self.tokens.append(Token(TokenType.ARROW, '->', start_line, start_col))
+            # Operators that may pair with a following character
+            elif char in self.PAIRED_TOKENS:
+                pair, paired_type, single_type = self.PAIRED_TOKENS[char]
+                if source.startswith(pair, self.pos):
+                    self.pos += 2
+                    self.column += 2
+                    append(Token(paired_type, pair, start_line, start_col))
                 else:
-                    self.tokens.append(Token(TokenType.MINUS, '-', start_line, start_col))
-            
-            elif char == '*':
-                self.advance()
-                if self.current_char() == '*':
                     self.advance()
-                    self.tokens.append(Token(TokenType.POWER, '**', start_line, start_col))
-                else:
-                    self.tokens.append(Token(TokenType.MULTIPLY, '*', start_line, start_col))
-            
-            elif char == '/':
-                self.advance()
-                self.tokens.append(Token(TokenType.DIVIDE, '/', start_line, start_col))
-            
-            elif char == '%':
-                self.advance()
-                self.tokens.append(Token(TokenType.MODULO, '%', start_line, start_col))
-            
-            elif char == '=':
-                self.advance()
-                if self.current_char() == '=':
-                    self.advance()
-                    self.tokens.append(Token(TokenType.EQ, '==', start_line, start_col))
-                else:
-                    self.tokens.append(Token(TokenType.ASSIGN, '=', start_line, start_col))
-            
-            elif char == '!':
-                self.advance()
-                if self.current_char() == '=':
-                    self.advance()
-                    self.tokens.append(Token(TokenType.NE, '!=', start_line, start_col))
-                else:
-                    self.error(f"Unexpected character '!'")
-            
-            elif char == '<':
-                self.advance()
-                if self.current_char() == '=':
-                    self.advance()
-                    self.tokens.append(Token(TokenType.LE, '<=', start_line, start_col))
-                else:
-                    self.tokens.append(Token(TokenType.LT, '<', start_line, start_col))
-            
-            elif char == '>':
-                self.advance()
-                if self.current_char() == '=':
-                    self.advance()
-                    self.tokens.append(Token(TokenType.GE, '>=', start_line, start_col))
-                else:
-                    self.tokens.append(Token(TokenType.GT, '>', start_line, start_col))
-            
-            elif char == '(':
-                self.advance()
-                self.tokens.append(Token(TokenType.LPAREN, '(', start_line, start_col))
-            
-            elif char == ')':
-                self.advance()
-                self.tokens.append(Token(TokenType.RPAREN, ')', start_line, start_col))
-            
-            elif char == '{':
-                self.advance()
-                self.tokens.append(Token(TokenType.LBRACE, '{', start_line, start_col))
-            
-            elif char == '}':
-                self.advance()
-                self.tokens.append(Token(TokenType.RBRACE, '}', start_line, start_col))
-            
-            elif char == '[':
-                self.advance()
-                self.tokens.append(Token(TokenType.LBRACKET, '[', start_line, start_col))
-            
-            elif char == ']':
-                self.advance()
-                self.tokens.append(Token(TokenType.RBRACKET, ']', start_line, start_col))
-            
-            elif char == ',':
-                self.advance()
-                self.tokens.append(Token(TokenType.COMMA, ',', start_line, start_col))
-            
-            elif char == ':':
-                self.advance()
-                self.tokens.append(Token(TokenType.COLON, ':', start_line, start_col))
+                    if single_type is None:
+                        self.error(f"Unexpected character '{char}'")
+                    append(Token(single_type, char, start_line, start_col))
             
             elif char == '.':
                 self.advance()
                 # Check if it's part of a number
-                if self.current_char() and self.current_char().isdigit():
+                if source[self.pos:self.pos + 1].isdecimal():
                     self.error("Numbers must start with a digit")
-                self.tokens.append(Token(TokenType.DOT, '.', start_line, start_col))
-            
-            elif char == '@':
-                self.advance()
-                self.tokens.append(Token(TokenType.AT, '@', start_line, start_col))
+                append(Token(_DOT, '.', start_line, start_col))
             
             else:
                 self.error(f"Unexpected character '{char}'")
@@ -438,9 +444,9 @@ class Lexer:
         # Add remaining DEDENT tokens
         while len(self.indent_stack) > 1:
             self.indent_stack.pop()
-            self.tokens.append(Token(TokenType.DEDENT, None, self.line, self.column))
+            append(Token(TokenType.DEDENT, None, self.line, self.column))
         
         # Add EOF token
-        self.tokens.append(Token(TokenType.EOF, None, self.line, self.column))
+        append(Token(TokenType.EOF, None, self.line, self.column))
         
         return self.tokens
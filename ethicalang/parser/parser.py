@@ -5,11 +5,83 @@ Converts a stream of tokens into an Abstract Syntax Tree (AST).
 Implements a hand-written recursive descent parser without external tools.
 """
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, NoReturn, Optional, Tuple
 from ..lexer.lexer import Token, TokenType
 from ..ast.nodes import *
 
 
+# Binding precedence of the binary operators, loosest first; parse_binary
+# climbs this table instead of recursing through one method per level
+_BINARY_PRECEDENCE = {
+    TokenType.OR: 1,
+    TokenType.AND: 2,
+    TokenType.EQ: 3,
+    TokenType.NE: 3,
+    TokenType.LT: 4,
+    TokenType.LE: 4,
+    TokenType.GT: 4,
+    TokenType.GE: 4,
+    TokenType.PLUS: 5,
+    TokenType.MINUS: 5,
+    TokenType.MULTIPLY: 6,
+    TokenType.DIVIDE: 6,
+    TokenType.MODULO: 6,
+}
+
+# Unary and power operator token types, tested with `in` on the current type
+_UNARY_OPERATORS = (TokenType.NOT, TokenType.MINUS)
+_POWER_OPERATORS = (TokenType.POWER,)
+
+# Literal token type -> (node class, type name) of the literal it parses to
+_LITERAL_KINDS = {
+    TokenType.INTEGER: (NumericLiteral, 'int'),
+    TokenType.FLOAT: (NumericLiteral, 'float'),
+    TokenType.STRING: (StringLiteral, 'string'),
+    TokenType.TRUE: (BoolLiteral, 'bool'),
+    TokenType.FALSE: (BoolLiteral, 'bool'),
+    TokenType.NONE: (Literal, 'none'),
+}
+
+# A single literal or name followed by one of these is a whole expression
+_SINGLE_TOKEN_EXPRESSIONS = frozenset(_LITERAL_KINDS) | {TokenType.IDENTIFIER}
+_EXPRESSION_ENDS = frozenset({
+    TokenType.NEWLINE,
+    TokenType.RPAREN,
+    TokenType.COMMA,
+    TokenType.COLON,
+    TokenType.RBRACKET,
+    TokenType.RBRACE,
+    TokenType.EOF,
+})
+
+
+# Token types the parser methods test against, bound once at import: on
+# CPython 3.11 every TokenType.X lookup goes through EnumType.__getattr__
+_ASSIGN = TokenType.ASSIGN
+_AT = TokenType.AT
+_COLON = TokenType.COLON
+_COMMA = TokenType.COMMA
+_DEDENT = TokenType.DEDENT
+_DOT = TokenType.DOT
+_ELSE = TokenType.ELSE
+_EOF = TokenType.EOF
+_FOR = TokenType.FOR
+_FUNCTION = TokenType.FUNCTION
+_IDENTIFIER = TokenType.IDENTIFIER
+_IF = TokenType.IF
+_IN = TokenType.IN
+_INDENT = TokenType.INDENT
+_LBRACE = TokenType.LBRACE
+_LBRACKET = TokenType.LBRACKET
+_LPAREN = TokenType.LPAREN
+_NEWLINE = TokenType.NEWLINE
+_RBRACE = TokenType.RBRACE
+_RBRACKET = TokenType.RBRACKET
+_RETURN = TokenType.RETURN
+_RPAREN = TokenType.RPAREN
+_WHILE = TokenType.WHILE
+
+
 class ParseError(Exception):
     """Exception raised when parsing fails"""
     pass
@@ -39,15 +111,35 @@ class Parser:
         power           → postfix ('**' postfix)*
         postfix         → primary (call | index | member)*
         primary         → literal | ID | '(' expression ')' | list | dict
+    
+    The binary levels from logical_or to factor are parsed by precedence
+    climbing in parse_binary rather than one method per level.
     """
     
     def __init__(self, tokens: List[Token]):
         """Initialize parser with token stream"""
         self.tokens = tokens
         self.pos = 0
-        self.current_token = tokens[0] if tokens else None
+        self.current_token: Optional[Token] = tokens[0] if tokens else None
+        # Type of the current token (None past the end), kept in step by advance()
+        self.current_type: Optional[TokenType] = self.current_token.type if tokens else None
+        # Literal nodes are immutable, so repeated constants share one node
+        self.literals: Dict[Tuple[str, Any], Literal] = {}
+        # Statements and primaries are dispatched on the current token type
+        self.statement_parsers = {
+            _IF: self.parse_if_statement,
+            _WHILE: self.parse_while_loop,
+            _FOR: self.parse_for_loop,
+            _RETURN: self.parse_return_statement,
+        }
+        self.primary_parsers = {
+            _IDENTIFIER: self.parse_variable,
+            _LPAREN: self.parse_grouping,
+            _LBRACKET: self.parse_list_literal,
+            _LBRACE: self.parse_dict_literal,
+        }
     
-    def error(self, message: str):
+    def error(self, message: str) -> NoReturn:
         """Raise a parse error with context"""
         if self.current_token:
             raise ParseError(
@@ -67,22 +159,23 @@ class Parser:
     def advance(self) -> Token:
         """Move to the next token"""
         token = self.current_token
-        self.pos += 1
-        if self.pos < len(self.tokens):
-            self.current_token = self.tokens[self.pos]
+        pos = self.pos = self.pos + 1
+        tokens = self.tokens
+        if pos < len(tokens):
+            next_token = self.current_token = tokens[pos]
+            self.current_type = next_token.type
         else:
             self.current_token = None
+            self.current_type = None
         return token
     
     def match(self, *token_types: TokenType) -> bool:
         """Check if current token matches any of the given types"""
-        if self.current_token is None:
-            return False
-        return self.current_token.type in token_types
+        return self.current_type in token_types
     
-    def consume(self, token_type: TokenType, message: str = None) -> Token:
+    def consume(self, token_type: TokenType, message: Optional[str] = None) -> Token:
         """Consume a token of the expected type or raise error"""
-        if not self.match(token_type):
+        if self.current_type is not token_type:
             if message:
                 self.error(message)
             else:
@@ -91,246 +184,202 @@ class Parser:
     
     def skip_newlines(self):
         """Skip any newline tokens"""
-        while self.match(TokenType.NEWLINE):
+        while self.match(_NEWLINE):
             self.advance()
     
     def parse(self) -> Program:
         """Parse the entire program"""
         statements = []
+        append = statements.append
         self.skip_newlines()
         
-        while not self.match(TokenType.EOF):
+        while not self.match(_EOF):
             stmt = self.parse_statement()
             if stmt:
-                statements.append(stmt)
+                append(stmt)
             self.skip_newlines()
         
-        return Program(statements)
+        return Program(tuple(statements))
     
     def parse_statement(self) -> Optional[ASTNode]:
-        """Parse a single statement"""
-        self.skip_newlines()
-        
-        # Annotations (for functions)
-        annotations = []
-        while self.match(TokenType.AT):
+        """Parse a single statement; the caller has already skipped newlines"""
+        # Annotations (for functions); most statements have none, so the
+        # list is only created on the first '@'
+        annotations = None
+        while self.match(_AT):
+            if annotations is None:
+                annotations = []
             annotations.append(self.parse_annotation())
             self.skip_newlines()
         
         # Function definition
-        if self.match(TokenType.FUNCTION):
+        if self.match(_FUNCTION):
             return self.parse_function_def(annotations)
         
-        # If statement
-        if self.match(TokenType.IF):
-            return self.parse_if_statement()
-        
-        # While loop
-        if self.match(TokenType.WHILE):
-            return self.parse_while_loop()
-        
-        # For loop
-        if self.match(TokenType.FOR):
-            return self.parse_for_loop()
-        
-        # Return statement
-        if self.match(TokenType.RETURN):
-            return self.parse_return_statement()
+        # If, while, for and return statements
+        parse_rule = self.statement_parsers.get(self.current_type)
+        if parse_rule is not None:
+            return parse_rule()
         
         # Assignment or expression statement
-        if self.match(TokenType.IDENTIFIER):
+        if self.match(_IDENTIFIER):
             # Look ahead to check for assignment
-            if self.peek(1) and self.peek(1).type == TokenType.ASSIGN:
+            next_pos = self.pos + 1
+            if next_pos < len(self.tokens) and self.tokens[next_pos].type is _ASSIGN:
                 return self.parse_assignment()
         
         # Expression statement (function call, etc.)
-        expr = self.parse_expression()
-        self.skip_newlines()
-        return expr
+        return self.parse_expression()
     
     def parse_annotation(self) -> Annotation:
         """Parse an annotation (@decorator)"""
-        self.consume(TokenType.AT)
-        name_token = self.consume(TokenType.IDENTIFIER, "Expected annotation name")
+        self.consume(_AT)
+        name_token = self.consume(_IDENTIFIER, "Expected annotation name")
         name = name_token.value
         
-        arguments = []
-        if self.match(TokenType.LPAREN):
+        arguments = ()
+        if self.match(_LPAREN):
             self.advance()
-            if not self.match(TokenType.RPAREN):
-                arguments.append(self.parse_expression())
-                while self.match(TokenType.COMMA):
-                    self.advance()
-                    arguments.append(self.parse_expression())
-            self.consume(TokenType.RPAREN)
+            arguments = tuple(self.parse_separated(self.parse_expression, _RPAREN))
         
         return Annotation(name, arguments)
     
-    def parse_function_def(self, annotations: List[Annotation] = None) -> FunctionDef:
+    def parse_function_def(self, annotations: Optional[List[Annotation]] = None) -> FunctionDef:
         """Parse a function definition"""
-        self.consume(TokenType.FUNCTION)
-        name_token = self.consume(TokenType.IDENTIFIER, "Expected function name")
+        self.consume(_FUNCTION)
+        name_token = self.consume(_IDENTIFIER, "Expected function name")
         name = name_token.value
         
-        self.consume(TokenType.LPAREN)
-        parameters = []
-        if not self.match(TokenType.RPAREN):
-            param_token = self.consume(TokenType.IDENTIFIER, "Expected parameter name")
-            parameters.append(param_token.value)
-            while self.match(TokenType.COMMA):
-                self.advance()
-                param_token = self.consume(TokenType.IDENTIFIER, "Expected parameter name")
-                parameters.append(param_token.value)
-        self.consume(TokenType.RPAREN)
+        self.consume(_LPAREN)
+        parameters = self.parse_separated(self.parse_parameter, _RPAREN)
         
-        self.consume(TokenType.COLON, "Expected ':' after function signature")
+        self.consume(_COLON, "Expected ':' after function signature")
         body = self.parse_block()
         
-        return FunctionDef(name, parameters, body, annotations or [])
+        return FunctionDef(name, parameters, body, tuple(annotations or ()))
+    
+    def parse_parameter(self) -> str:
+        """Parse a function parameter name"""
+        return self.consume(_IDENTIFIER, "Expected parameter name").value
+    
+    def parse_separated(self, parse_item: Callable[[], Any], closing_type: TokenType,
+                        trailing_comma: bool = False) -> list:
+        """
+        Parse comma-separated items up to and including the closing token
+        
+        Args:
+            parse_item: Parses one item and returns it
+            closing_type: Token type that ends the list
+            trailing_comma: Whether a comma may follow the last item
+        """
+        items = []
+        if self.current_type is not closing_type:
+            items.append(parse_item())
+            while self.match(_COMMA):
+                self.advance()
+                if trailing_comma and self.current_type is closing_type:
+                    break
+                items.append(parse_item())
+        self.consume(closing_type)
+        return items
     
-    def parse_block(self) -> List[ASTNode]:
+    def parse_block(self) -> Tuple[ASTNode, ...]:
         """Parse a block of statements (indented)"""
         self.skip_newlines()
-        self.consume(TokenType.INDENT, "Expected indented block")
+        self.consume(_INDENT, "Expected indented block")
         
         statements = []
-        while not self.match(TokenType.DEDENT, TokenType.EOF):
+        append = statements.append
+        while not self.match(_DEDENT, _EOF):
             stmt = self.parse_statement()
             if stmt:
-                statements.append(stmt)
+                append(stmt)
             self.skip_newlines()
         
-        self.consume(TokenType.DEDENT, "Expected dedent")
-        return statements
+        self.consume(_DEDENT, "Expected dedent")
+        return tuple(statements)
     
     def parse_if_statement(self) -> IfStatement:
         """Parse an if statement"""
-        self.consume(TokenType.IF)
+        self.consume(_IF)
         condition = self.parse_expression()
-        self.consume(TokenType.COLON)
+        self.consume(_COLON)
         then_body = self.parse_block()
         
         else_body = None
-        if self.match(TokenType.ELSE):
+        if self.match(_ELSE):
             self.advance()
-            self.consume(TokenType.COLON)
+            self.consume(_COLON)
             else_body = self.parse_block()
         
         return IfStatement(condition, then_body, else_body)
     
     def parse_while_loop(self) -> WhileLoop:
         """Parse a while loop"""
-        self.consume(TokenType.WHILE)
+        self.consume(_WHILE)
         condition = self.parse_expression()
-        self.consume(TokenType.COLON)
+        self.consume(_COLON)
         body = self.parse_block()
         
         return WhileLoop(condition, body)
     
     def parse_for_loop(self) -> ForLoop:
         """Parse a for loop"""
-        self.consume(TokenType.FOR)
-        var_token = self.consume(TokenType.IDENTIFIER, "Expected loop variable")
+        self.consume(_FOR)
+        var_token = self.consume(_IDENTIFIER, "Expected loop variable")
         variable = var_token.value
-        self.consume(TokenType.IN, "Expected 'in' keyword")
+        self.consume(_IN, "Expected 'in' keyword")
         iterable = self.parse_expression()
-        self.consume(TokenType.COLON)
+        self.consume(_COLON)
         body = self.parse_block()
         
         return ForLoop(variable, iterable, body)
     
     def parse_return_statement(self) -> ReturnStatement:
         """Parse a return statement"""
-        self.consume(TokenType.RETURN)
+        self.consume(_RETURN)
         
         value = None
-        if not self.match(TokenType.NEWLINE, TokenType.EOF):
+        if not self.match(_NEWLINE, _EOF):
             value = self.parse_expression()
         
         return ReturnStatement(value)
     
     def parse_assignment(self) -> Assignment:
         """Parse an assignment statement"""
-        name_token = self.consume(TokenType.IDENTIFIER)
+        name_token = self.consume(_IDENTIFIER)
         name = name_token.value
-        self.consume(TokenType.ASSIGN)
+        self.consume(_ASSIGN)
         value = self.parse_expression()
         
         return Assignment(name, value)
     
     def parse_expression(self) -> ASTNode:
         """Parse an expression"""
-        return self.parse_logical_or()
-    
-    def parse_logical_or(self) -> ASTNode:
-        """Parse logical OR expression"""
-        left = self.parse_logical_and()
-        
-        while self.match(TokenType.OR):
-            op = self.advance().value
-            right = self.parse_logical_and()
-            left = BinaryOp(left, 'or', right)
-        
-        return left
-    
-    def parse_logical_and(self) -> ASTNode:
-        """Parse logical AND expression"""
-        left = self.parse_equality()
-        
-        while self.match(TokenType.AND):
-            op = self.advance().value
-            right = self.parse_equality()
-            left = BinaryOp(left, 'and', right)
-        
-        return left
-    
-    def parse_equality(self) -> ASTNode:
-        """Parse equality comparison"""
-        left = self.parse_comparison()
-        
-        while self.match(TokenType.EQ, TokenType.NE):
-            op = self.advance().value
-            right = self.parse_comparison()
-            left = BinaryOp(left, op, right)
-        
-        return left
-    
-    def parse_comparison(self) -> ASTNode:
-        """Parse comparison expression"""
-        left = self.parse_term()
-        
-        while self.match(TokenType.LT, TokenType.LE, TokenType.GT, TokenType.GE):
-            op = self.advance().value
-            right = self.parse_term()
-            left = BinaryOp(left, op, right)
-        
-        return left
+        # Arguments, list elements and the like are often a lone literal or
+        # name; parse those straight away instead of through every level
+        next_pos = self.pos + 1
+        if (self.current_type in _SINGLE_TOKEN_EXPRESSIONS and next_pos < len(self.tokens)
+                and self.tokens[next_pos].type in _EXPRESSION_ENDS):
+            return self.parse_primary()
+        return self.parse_binary()
     
-    def parse_term(self) -> ASTNode:
-        """Parse addition/subtraction"""
-        left = self.parse_factor()
-        
-        while self.match(TokenType.PLUS, TokenType.MINUS):
-            op = self.advance().value
-            right = self.parse_factor()
-            left = BinaryOp(left, op, right)
-        
-        return left
-    
-    def parse_factor(self) -> ASTNode:
-        """Parse multiplication/division/modulo"""
+    def parse_binary(self, min_precedence: int = 1) -> ASTNode:
+        """Parse binary operations binding at least as tightly as min_precedence"""
         left = self.parse_unary()
         
-        while self.match(TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULO):
+        precedence = _BINARY_PRECEDENCE.get(self.current_type)
+        while precedence is not None and precedence >= min_precedence:
             op = self.advance().value
-            right = self.parse_unary()
+            right = self.parse_binary(precedence + 1)  # Left associative
             left = BinaryOp(left, op, right)
+            precedence = _BINARY_PRECEDENCE.get(self.current_type)
         
         return left
     
     def parse_unary(self) -> ASTNode:
         """Parse unary operations"""
-        if self.match(TokenType.NOT, TokenType.MINUS):
+        if self.current_type in _UNARY_OPERATORS:
             op = self.advance().value
             operand = self.parse_unary()
             return UnaryOp(op, operand)
@@ -339,43 +388,39 @@ class Parser:
     
     def parse_power(self) -> ASTNode:
         """Parse power operation"""
-        left = self.parse_postfix()
-        
-        if self.match(TokenType.POWER):
+        operands = [self.parse_postfix()]
+        while self.current_type in _POWER_OPERATORS:
             op = self.advance().value
-            right = self.parse_power()  # Right associative
-            left = BinaryOp(left, op, right)
+            operands.append(self.parse_postfix())
         
-        return left
+        # Right associative: fold the chain from the right
+        right = operands.pop()
+        while operands:
+            right = BinaryOp(operands.pop(), op, right)
+        return right
     
     def parse_postfix(self) -> ASTNode:
         """Parse postfix operations (function call, member access, indexing)"""
         expr = self.parse_primary()
         
         while True:
-            if self.match(TokenType.LPAREN):
+            if self.match(_LPAREN):
                 # Function call
                 self.advance()
-                arguments = []
-                if not self.match(TokenType.RPAREN):
-                    arguments.append(self.parse_expression())
-                    while self.match(TokenType.COMMA):
-                        self.advance()
-                        arguments.append(self.parse_expression())
-                self.consume(TokenType.RPAREN)
-                expr = FunctionCall(expr, arguments)
+                arguments = self.parse_separated(self.parse_expression, _RPAREN)
+                expr = FunctionCall(expr, tuple(arguments))
             
-            elif self.match(TokenType.LBRACKET):
+            elif self.match(_LBRACKET):
                 # Index access
                 self.advance()
                 index = self.parse_expression()
-                self.consume(TokenType.RBRACKET)
+                self.consume(_RBRACKET)
                 expr = IndexAccess(expr, index)
             
-            elif self.match(TokenType.DOT):
+            elif self.match(_DOT):
                 # Member access
                 self.advance()
-                member_token = self.consume(TokenType.IDENTIFIER, "Expected member name")
+                member_token = self.consume(_IDENTIFIER, "Expected member name")
                 expr = MemberAccess(expr, member_token.value)
             
             else:
@@ -383,87 +428,58 @@ class Parser:
         
         return expr
     
+    def make_literal(self, literal_class: type, value: Any, type_name: str) -> Literal:
+        """Return the literal node for a constant, shared by its occurrences"""
+        key = (type_name, value)
+        node = self.literals.get(key)
+        if node is None:
+            node = self.literals[key] = literal_class(value, type_name)
+        return node
+    
     def parse_primary(self) -> ASTNode:
         """Parse primary expressions (literals, variables, parenthesized expressions)"""
         
         # Literals
-        if self.match(TokenType.INTEGER):
-            token = self.advance()
-            return Literal(token.value, 'int')
-        
-        if self.match(TokenType.FLOAT):
-            token = self.advance()
-            return Literal(token.value, 'float')
-        
-        if self.match(TokenType.STRING):
+        literal_kind = _LITERAL_KINDS.get(self.current_type)
+        if literal_kind is not None:
             token = self.advance()
-            return Literal(token.value, 'string')
+            literal_class, type_name = literal_kind
+            return self.make_literal(literal_class, token.value, type_name)
         
-        if self.match(TokenType.TRUE, TokenType.FALSE):
-            token = self.advance()
-            return Literal(token.value, 'bool')
-        
-        if self.match(TokenType.NONE):
-            self.advance()
-            return Literal(None, 'none')
-        
-        # Variable
-        if self.match(TokenType.IDENTIFIER):
-            token = self.advance()
-            return Variable(token.value)
-        
-        # Parenthesized expression
-        if self.match(TokenType.LPAREN):
-            self.advance()
-            expr = self.parse_expression()
-            self.consume(TokenType.RPAREN, "Expected ')' after expression")
-            return expr
-        
-        # List literal
-        if self.match(TokenType.LBRACKET):
-            return self.parse_list_literal()
-        
-        # Dict literal
-        if self.match(TokenType.LBRACE):
-            return self.parse_dict_literal()
+        # Variables, parenthesized expressions, list and dict literals
+        parse_rule = self.primary_parsers.get(self.current_type)
+        if parse_rule is not None:
+            return parse_rule()
         
         self.error(f"Unexpected token: {self.current_token.type.name if self.current_token else 'EOF'}")
     
+    def parse_variable(self) -> Variable:
+        """Parse a variable reference"""
+        token = self.consume(_IDENTIFIER)
+        return Variable(token.value)
+    
+    def parse_grouping(self) -> ASTNode:
+        """Parse a parenthesized expression"""
+        self.consume(_LPAREN)
+        expr = self.parse_expression()
+        self.consume(_RPAREN, "Expected ')' after expression")
+        return expr
+    
     def parse_list_literal(self) -> ListLiteral:
         """Parse a list literal"""
-        self.consume(TokenType.LBRACKET)
-        elements = []
-        
-        if not self.match(TokenType.RBRACKET):
-            elements.append(self.parse_expression())
-            while self.match(TokenType.COMMA):
-                self.advance()
-                if self.match(TokenType.RBRACKET):  # Trailing comma
-                    break
-                elements.append(self.parse_expression())
-        
-        self.consume(TokenType.RBRACKET)
-        return ListLiteral(elements)
+        self.consume(_LBRACKET)
+        elements = self.parse_separated(self.parse_expression, _RBRACKET, trailing_comma=True)
+        return ListLiteral(tuple(elements))
     
     def parse_dict_literal(self) -> DictLiteral:
         """Parse a dictionary literal"""
-        self.consume(TokenType.LBRACE)
-        pairs = []
-        
-        if not self.match(TokenType.RBRACE):
-            key = self.parse_expression()
-            self.consume(TokenType.COLON)
-            value = self.parse_expression()
-            pairs.append((key, value))
-            
-            while self.match(TokenType.COMMA):
-                self.advance()
-                if self.match(TokenType.RBRACE):  # Trailing comma
-                    break
-                key = self.parse_expression()
-                self.consume(TokenType.COLON)
-                value = self.parse_expression()
-                pairs.append((key, value))
-        
-        self.consume(TokenType.RBRACE)
-        return DictLiteral(pairs)
+        self.consume(_LBRACE)
+        pairs = self.parse_separated(self.parse_dict_entry, _RBRACE, trailing_comma=True)
+        return DictLiteral(tuple(pairs))
+    
+    def parse_dict_entry(self) -> Tuple[ASTNode, ASTNode]:
+        """Parse a key: value pair of a dictionary literal"""
+        key = self.parse_expression()
+        self.consume(_COLON)
+        value = self.parse_expression()
+        return (key, value)
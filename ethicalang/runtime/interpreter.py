@@ -5,6 +5,7 @@ Executes EthicaLang programs by walking the Abstract Syntax Tree.
 Implements a tree-walking interpreter with environment-based scoping.
 """
 
+import operator
 from typing import Any, Dict, List, Optional
 from ..ast.nodes import *
 
@@ -14,10 +15,39 @@ class RuntimeError(Exception):
     pass
 
 
-class ReturnValue(Exception):
-    """Exception used to implement return statements"""
-    def __init__(self, value):
-        self.value = value
+def _divide(left, right):
+    """Division that reports a zero divisor as a runtime error"""
+    if right == 0:
+        raise RuntimeError("Division by zero")
+    return left / right
+
+
+# Binary operators other than the short-circuiting 'and'/'or'
+_BINARY_OPERATORS = {
+    # Arithmetic operators
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': _divide,
+    '%': operator.mod,
+    '**': operator.pow,
+    
+    # Comparison operators
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+
+# Value types whose Python truthiness is exactly EthicaLang's; values of
+# any other type (functions, builtins) are always truthy
+_TRUTHY_BY_BOOL = frozenset({type(None), bool, int, float, str, list, dict})
+
+# Literal node classes the parser produces, read inline by Interpreter.visit
+_LITERAL_CLASSES = frozenset({Literal, StringLiteral, NumericLiteral, BoolLiteral})
 
 
 class Environment:
@@ -26,6 +56,8 @@ class Environment:
     Implements lexical scoping with parent chain
     """
     
+    __slots__ = ('parent', 'bindings')
+    
     def __init__(self, parent: Optional['Environment'] = None):
         self.parent = parent
         self.bindings: Dict[str, Any] = {}
@@ -36,27 +68,33 @@ class Environment:
     
     def get(self, name: str) -> Any:
         """Get a variable's value, checking parent scopes if needed"""
-        if name in self.bindings:
-            return self.bindings[name]
-        if self.parent:
-            return self.parent.get(name)
+        # Walk the chain in a loop rather than recursing once per scope
+        env = self
+        while env is not None:
+            bindings = env.bindings
+            if name in bindings:
+                return bindings[name]
+            env = env.parent
         raise RuntimeError(f"Undefined variable: {name}")
     
     def set(self, name: str, value: Any):
         """Set a variable's value, checking parent scopes if needed"""
-        if name in self.bindings:
-            self.bindings[name] = value
-        elif self.parent:
-            self.parent.set(name, value)
-        else:
-            raise RuntimeError(f"Undefined variable: {name}")
+        env = self
+        while env is not None:
+            bindings = env.bindings
+            if name in bindings:
+                bindings[name] = value
+                return
+            env = env.parent
+        raise RuntimeError(f"Undefined variable: {name}")
     
     def exists(self, name: str) -> bool:
         """Check if a variable exists"""
-        if name in self.bindings:
-            return True
-        if self.parent:
-            return self.parent.exists(name)
+        env = self
+        while env is not None:
+            if name in env.bindings:
+                return True
+            env = env.parent
         return False
 
 
@@ -68,6 +106,9 @@ class Interpreter(ASTVisitor):
     Maintains environment chain for scoping.
     """
     
+    # Most print lines held before they are written to stdout
+    OUTPUT_BUFFER_LINES = 64
+    
     def __init__(self, output_callback=None):
         """
         Initialize interpreter
@@ -75,9 +116,22 @@ class Interpreter(ASTVisitor):
         Args:
             output_callback: Function to call for print output (default: print)
         """
+        super().__init__()
         self.global_env = Environment()
         self.current_env = self.global_env
-        self.output_callback = output_callback or print
+        # Output to the default stdout is collected and written in batches:
+        # after each top-level statement, or once OUTPUT_BUFFER_LINES lines
+        # are pending, so a long-running statement still shows progress
+        self._output_buffer: Optional[List[str]] = None
+        if output_callback is None:
+            self._output_buffer = []
+            output_callback = self._buffer_output
+        self.output_callback = output_callback
+        
+        # A return statement sets _returning; every statement loop stops
+        # when it sees the flag and the enclosing call collects the value
+        self._returning = False
+        self._return_value = None
         
         # Register built-in functions
         self._register_builtins()
@@ -86,7 +140,9 @@ class Interpreter(ASTVisitor):
         """Register built-in functions"""
         self.global_env.define('print', self._builtin_print)
         self.global_env.define('len', self._builtin_len)
-        self.global_env.define('range', self._builtin_range)
+        # Kept so for loops can recognise calls to the unshadowed builtin
+        self._range_builtin = self._builtin_range
+        self.global_env.define('range', self._range_builtin)
         self.global_env.define('str', self._builtin_str)
         self.global_env.define('int', self._builtin_int)
         self.global_env.define('float', self._builtin_float)
@@ -98,7 +154,10 @@ class Interpreter(ASTVisitor):
     
     def _builtin_print(self, *args):
         """Built-in print function"""
-        output = ' '.join(str(arg) for arg in args)
+        if len(args) == 1 and args[0].__class__ is str:
+            output = args[0]
+        else:
+            output = ' '.join(str(arg) for arg in args)
         self.output_callback(output)
         return None
     
@@ -173,16 +232,56 @@ class Interpreter(ASTVisitor):
             Result of execution (usually None)
         """
         try:
-            return self.visit(ast)
-        except ReturnValue as rv:
+            result = self.visit(ast)
+        finally:
+            # Also on errors, so output comes before the error report
+            self._flush_output()
+        if self._returning:
             # Top-level return (unusual but allowed)
-            return rv.value
+            self._returning = False
+            return self._return_value
+        return result
+    
+    def _buffer_output(self, line: str):
+        """Queue a line of print output, writing the batch once it is full"""
+        buffer = self._output_buffer
+        buffer.append(line)
+        if len(buffer) >= self.OUTPUT_BUFFER_LINES:
+            self._flush_output()
+    
+    def _flush_output(self):
+        """Write buffered print output to stdout"""
+        buffer = self._output_buffer
+        if buffer:
+            print('\n'.join(buffer))
+            buffer.clear()
+    
+    def visit(self, node: ASTNode):
+        """Dispatch to the visit method, reading literals and variables inline"""
+        # These two are most of the nodes evaluated; handling them here
+        # saves a method call for each
+        cls = node.__class__
+        if cls in _LITERAL_CLASSES:
+            return node.value
+        if cls is Variable:
+            return self.current_env.get(node.name)
+        
+        try:
+            visitor = self._visitors[cls]
+        except KeyError:
+            return ASTVisitor.visit(self, node)
+        return visitor(self, node)
     
     def visit_Program(self, node: Program):
         """Visit program node"""
         result = None
+        buffered = self._output_buffer is not None
         for stmt in node.statements:
             result = self.visit(stmt)
+            if buffered:
+                self._flush_output()
+            if self._returning:
+                break
         return result
     
     def visit_FunctionDef(self, node: FunctionDef):
@@ -211,52 +310,25 @@ class Interpreter(ASTVisitor):
         left = self.visit(node.left)
         
         # Short-circuit evaluation for logical operators
+        # The result is always a bool, and once the left operand hasn't
+        # decided it, it is the right operand's truthiness
         if node.operator == 'and':
             if not self._is_truthy(left):
                 return False
-            right = self.visit(node.right)
-            return self._is_truthy(left) and self._is_truthy(right)
+            return self._is_truthy(self.visit(node.right))
         
         if node.operator == 'or':
             if self._is_truthy(left):
                 return True
-            right = self.visit(node.right)
-            return self._is_truthy(left) or self._is_truthy(right)
+            return self._is_truthy(self.visit(node.right))
         
         right = self.visit(node.right)
         
-        # Arithmetic operators
-        if node.operator == '+':
-            return left + right
-        elif node.operator == '-':
-            return left - right
-        elif node.operator == '*':
-            return left * right
-        elif node.operator == '/':
-            if right == 0:
-                raise RuntimeError("Division by zero")
-            return left / right
-        elif node.operator == '%':
-            return left % right
-        elif node.operator == '**':
-            return left ** right
-        
-        # Comparison operators
-        elif node.operator == '==':
-            return left == right
-        elif node.operator == '!=':
-            return left != right
-        elif node.operator == '<':
-            return left < right
-        elif node.operator == '<=':
-            return left <= right
-        elif node.operator == '>':
-            return left > right
-        elif node.operator == '>=':
-            return left >= right
-        
-        else:
+        # One table lookup instead of comparing against every operator
+        apply = _BINARY_OPERATORS.get(node.operator)
+        if apply is None:
             raise RuntimeError(f"Unknown operator: {node.operator}")
+        return apply(left, right)
     
     def visit_UnaryOp(self, node: UnaryOp):
         """Visit unary operation"""
@@ -275,10 +347,16 @@ class Interpreter(ASTVisitor):
     
     def visit_ListLiteral(self, node: ListLiteral):
         """Visit list literal"""
+        if node.constant_elements is not None:
+            return list(node.constant_elements)
         return [self.visit(elem) for elem in node.elements]
     
     def visit_DictLiteral(self, node: DictLiteral):
         """Visit dictionary literal"""
+        if node.constant_pairs is not None:
+            # Literal keys are always of a hashable type
+            return dict(node.constant_pairs)
+        
         result = {}
         for key_node, value_node in node.pairs:
             key = self.visit(key_node)
@@ -296,78 +374,118 @@ class Interpreter(ASTVisitor):
         if self._is_truthy(condition):
             for stmt in node.then_body:
                 self.visit(stmt)
+                if self._returning:
+                    break
         elif node.else_body:
             for stmt in node.else_body:
                 self.visit(stmt)
+                if self._returning:
+                    break
         
         return None
     
     def visit_WhileLoop(self, node: WhileLoop):
         """Visit while loop"""
-        while self._is_truthy(self.visit(node.condition)):
-            for stmt in node.body:
-                self.visit(stmt)
+        # Loop invariants bound once rather than looked up per iteration
+        condition = node.condition
+        body = node.body
+        visit = self.visit
+        is_truthy = self._is_truthy
+        
+        while is_truthy(visit(condition)):
+            for stmt in body:
+                visit(stmt)
+                if self._returning:
+                    return None
         
         return None
     
     def visit_ForLoop(self, node: ForLoop):
         """Visit for loop"""
-        iterable = self.visit(node.iterable)
-        
-        if not isinstance(iterable, (list, str)):
-            raise RuntimeError(f"Cannot iterate over {type(iterable).__name__}")
+        # A constant list literal is iterated directly; the loop can't
+        # observe that no list was built
+        iterable = node.iterable
+        if iterable.__class__ is ListLiteral and iterable.constant_elements is not None:
+            iterable = iterable.constant_elements
+        elif (iterable.__class__ is FunctionCall and iterable.callee_name == 'range'
+              and self.current_env.get('range') is self._range_builtin):
+            iterable = self._loop_range(iterable)
+        else:
+            iterable = self.visit(iterable)
+            if not isinstance(iterable, (list, str)):
+                raise RuntimeError(f"Cannot iterate over {type(iterable).__name__}")
         
         # Create new scope for loop variable
         loop_env = Environment(self.current_env)
         old_env = self.current_env
         self.current_env = loop_env
         
+        # Loop invariants bound once rather than looked up per iteration
+        variable = node.variable
+        body = node.body
+        visit = self.visit
+        bindings = loop_env.bindings
+        
         try:
             for item in iterable:
-                self.current_env.define(node.variable, item)
-                for stmt in node.body:
-                    self.visit(stmt)
+                bindings[variable] = item
+                for stmt in body:
+                    visit(stmt)
+                    if self._returning:
+                        return None
         finally:
             self.current_env = old_env
         
         return None
     
+    def _loop_range(self, call: FunctionCall) -> range:
+        """Evaluate a range() call iterated by a for loop without building a list"""
+        args = [self.visit(arg) for arg in call.arguments]
+        if not 1 <= len(args) <= 3:
+            raise RuntimeError("Error calling built-in function: range() takes 1 to 3 arguments")
+        try:
+            return range(*args)
+        except Exception as e:
+            raise RuntimeError(f"Error calling built-in function: {e}")
+    
     def visit_ReturnStatement(self, node: ReturnStatement):
         """Visit return statement"""
         value = None
-        if node.value:
+        if node.value is not None:
             value = self.visit(node.value)
-        raise ReturnValue(value)
+        self._return_value = value
+        self._returning = True
+        return None
     
     def visit_FunctionCall(self, node: FunctionCall):
         """Visit function call"""
-        function = self.visit(node.function)
+        # Calls are almost always by name; look the name up directly rather
+        # than dispatching through visit_Variable
+        callee = node.function
+        if callee.__class__ is Variable:
+            function = self.current_env.get(callee.name)
+        else:
+            function = self.visit(callee)
         
         # Evaluate arguments
         args = [self.visit(arg) for arg in node.arguments]
         
-        # Built-in function (Python callable)
-        if callable(function) and not isinstance(function, FunctionDef):
-            try:
-                return function(*args)
-            except Exception as e:
-                raise RuntimeError(f"Error calling built-in function: {e}")
-        
-        # User-defined function
-        if isinstance(function, FunctionDef):
+        # User-defined function; tested by class identity first since these
+        # calls dominate recursive programs
+        if function.__class__ is FunctionDef:
             # Check argument count
-            if len(args) != len(function.parameters):
+            parameters = function.parameters
+            if len(args) != len(parameters):
                 raise RuntimeError(
-                    f"Function {function.name} expects {len(function.parameters)} "
+                    f"Function {function.name} expects {len(parameters)} "
                     f"arguments, got {len(args)}"
                 )
             
             # Create new environment for function
             func_env = Environment(self.global_env)
             
-            # Bind parameters
-            for param, arg in zip(function.parameters, args):
-                func_env.define(param, arg)
+            # Bind parameters in one step rather than one define() call each
+            func_env.bindings.update(zip(parameters, args))
             
             # Execute function body
             old_env = self.current_env
@@ -376,13 +494,21 @@ class Interpreter(ASTVisitor):
             try:
                 for stmt in function.body:
                     self.visit(stmt)
+                    if self._returning:
+                        self._returning = False
+                        return self._return_value
                 # No explicit return
                 return None
-            except ReturnValue as rv:
-                return rv.value
             finally:
                 self.current_env = old_env
         
+        # Built-in function (Python callable)
+        if callable(function):
+            try:
+                return function(*args)
+            except Exception as e:
+                raise RuntimeError(f"Error calling built-in function: {e}")
+        
         raise RuntimeError(f"Cannot call {type(function).__name__}")
     
     def visit_MemberAccess(self, node: MemberAccess):
@@ -421,10 +547,6 @@ class Interpreter(ASTVisitor):
         - False, None, 0, empty collections are falsy
         - Everything else is truthy
         """
-        if value is None or value is False:
-            return False
-        if value == 0 or value == 0.0:
-            return False
-        if isinstance(value, (str, list, dict)) and len(value) == 0:
-            return False
+        if value.__class__ in _TRUTHY_BY_BOOL:
+            return bool(value)
         return True
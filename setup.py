@@ -2,6 +2,7 @@
 Setup configuration for EthicaLang
 """
 
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -9,6 +10,29 @@ from pathlib import Path
 readme_file = Path(__file__).parent / 'README.md'
 long_description = readme_file.read_text() if readme_file.exists() else ''
 
+# Optionally compile the lexer, parser and hottest analyzers with Cython
+# (pure-Python mode: the sources stay plain .py files). Opt in with
+# ETHICALANG_COMPILE=1; without it, or without Cython installed, the
+# package is pure Python.
+COMPILED_MODULES = [
+    'ethicalang/lexer/lexer.py',
+    'ethicalang/parser/parser.py',
+    'ethicalang/analysis/ethics.py',
+    'ethicalang/analysis/readability.py',
+]
+
+
+def compiled_extensions():
+    """Return the Cython extension modules to build, or [] for pure Python"""
+    if os.environ.get('ETHICALANG_COMPILE') != '1':
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    return cythonize(COMPILED_MODULES, compiler_directives={'language_level': 3})
+
+
 setup(
     name='ethicalang',
     version='1.0.0',
@@ -19,20 +43,20 @@ setup(
     long_description_content_type='text/markdown',
     url='https://github.com/yourusername/ethicalang',
     packages=find_packages(),
+    ext_modules=compiled_extensions(),
     classifiers=[
         'Development Status :: 4 - Beta',
         'Intended Audience :: Developers',
         'Topic :: Software Development :: Compilers',
         'Topic :: Software Development :: Interpreters',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
         'Programming Language :: Python :: 3.10',
         'Programming Language :: Python :: 3.11',
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.8',
+    python_requires='>=3.9',
     install_requires=[
         # No external dependencies - pure Python!
     ],
@@ -9,6 +9,7 @@ from ethicalang.analysis.energy import EnergyAnalyzer
 from ethicalang.analysis.ethics import EthicsChecker
 from ethicalang.analysis.readability import ReadabilityScorer
 from ethicalang.analysis.cleverness import ClevernessDetector
+from ethicalang.analysis.combined import CombinedAnalyzer
 
 
 class TestAnalyzers:
@@ -51,6 +52,19 @@ result = add(1, 2)
         assert not results['within_budget']
         assert len(results['violations']) > 0
     
+    def test_energy_detects_nested_recursion(self):
+        """Test that recursive calls inside expressions are detected"""
+        source = """function fib(n):
+    if n <= 1:
+        return n
+    return fib(n - 1) + fib(n - 2)
+"""
+        ast = self.parse(source)
+        analyzer = EnergyAnalyzer(budget=100000)
+        results = analyzer.analyze(ast)
+        
+        assert any(v['type'] == 'recursion_detected' for v in results['violations'])
+    
     def test_ethics_missing_consent(self):
         """Test that missing consent annotation fails ethics check"""
         source = """function collect_location():
@@ -75,6 +89,16 @@ function collect_location():
         
         assert results['passed']
     
+    def test_ethics_secret_check_uses_lowercase_match(self):
+        """Test that only a lowercase keyword match counts as a hardcoded secret"""
+        checker = EthicsChecker(strict_mode=False)
+        
+        flagged = checker.analyze(self.parse('x = "MyPassword"\n'))
+        assert [v['type'] for v in flagged['violations']] == ['hardcoded_secret']
+        
+        # 'ſ' (long s) case-folds to 's' but str.lower() leaves it alone
+        assert checker.analyze(self.parse('x = "pa\u017fsword"\n'))['passed']
+    
     def test_readability_good_code(self):
         """Test that readable code passes readability check"""
         source = """function calculate_average(numbers):
@@ -109,6 +133,25 @@ function collect_location():
         assert not results['passed']
         assert results['overall_score'] < 70
     
+    def test_readability_reuse_gives_same_results(self):
+        """Test that analyzing twice with one scorer doesn't carry state over"""
+        source = """function f(a):
+    if a > 1:
+        x = a
+    else:
+        x = 0
+    return x
+
+y = f(2)
+"""
+        ast = self.parse(source)
+        scorer = ReadabilityScorer(min_score=70)
+        first = scorer.analyze(ast)
+        
+        assert scorer.analyze(ast) == first
+        assert scorer.analyze(self.parse("total_count = 1\n")) == \
+            ReadabilityScorer(min_score=70).analyze(self.parse("total_count = 1\n"))
+    
     def test_cleverness_simple_passes(self):
         """Test that simple code passes cleverness check"""
         source = """function add_numbers(first, second):
@@ -132,3 +175,88 @@ function collect_location():
         
         assert not results['passed']
         assert len(results['violations']) > 0
+    
+    def test_cleverness_strict_mode_stops_at_first_violation(self):
+        """Test that strict mode aborts the walk after the first violation"""
+        source = """function calculate(x, y, z):
+    return ((x + y) * (z - x) + (y * z)) / ((x + z) - (y - x))
+
+value = 12345
+"""
+        ast = self.parse(source)
+        strict = ClevernessDetector(strict_mode=True).analyze(ast)
+        lenient = ClevernessDetector(strict_mode=False).analyze(ast)
+        
+        assert len(strict['violations']) == 1
+        assert strict['violations'][0] == lenient['violations'][0]
+        assert len(lenient['violations']) > 1
+    
+    def test_energy_counts_branch_cost_once(self):
+        """Test that an if statement adds only its most expensive branch"""
+        source = """x = 1
+if x:
+    y = 2
+"""
+        ast = self.parse(source)
+        results = EnergyAnalyzer(budget=1000).analyze(ast)
+        
+        # x = 1 (3) + condition check (5) + x (1) + then branch (3)
+        assert results['total_cost'] == 12
+    
+    def test_combined_matches_separate_analyzers(self):
+        """Test that a combined pass gives the same results as separate passes"""
+        source = """function calculate(x, y, z):
+    total = 0
+    for item in [1, 2, 3]:
+        total = total + item * x
+    return ((x + y) * (z - x) + (y * z)) / ((x + z) - (y - x))
+
+result = calculate(1, 2, 3)
+"""
+        ast = self.parse(source)
+        combined = CombinedAnalyzer({
+            'energy': EnergyAnalyzer(budget=50),
+            'cleverness': ClevernessDetector(strict_mode=False),
+        }).analyze(ast)
+        
+        assert combined['energy'] == EnergyAnalyzer(budget=50).analyze(ast)
+        assert combined['cleverness'] == ClevernessDetector(strict_mode=False).analyze(ast)
+    
+    def test_combined_ethics_and_readability(self):
+        """Test that ethics and readability give the same results in a combined pass"""
+        source = """function track_user(x):
+    if x > 1:
+        tmp = x
+    else:
+        tmp = 0
+    return tmp
+
+track_user(1)
+"""
+        ast = self.parse(source)
+        combined = CombinedAnalyzer({
+            'ethics': EthicsChecker(strict_mode=False),
+            'readability': ReadabilityScorer(min_score=70),
+        }).analyze(ast)
+        
+        assert not combined['ethics']['passed']
+        assert combined['ethics'] == EthicsChecker(strict_mode=False).analyze(ast)
+        assert combined['readability'] == ReadabilityScorer(min_score=70).analyze(ast)
+    
+    def test_combined_isolates_failing_analyzer(self):
+        """Test that an analyzer raising in a hook doesn't affect the others"""
+        class FailingScorer(ReadabilityScorer):
+            def enter_Assignment(self, node):
+                raise ValueError("boom")
+        
+        ast = self.parse("total = 1\n")
+        combined = CombinedAnalyzer({
+            'energy': EnergyAnalyzer(budget=1000),
+            'readability': FailingScorer(),
+        })
+        results = combined.analyze(ast)
+        
+        assert 'readability' not in results
+        assert str(combined.errors['readability']) == "boom"
+        assert list(combined.errors) == ['readability']
+        assert results['energy'] == EnergyAnalyzer(budget=1000).analyze(ast)
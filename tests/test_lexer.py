@@ -2,70 +2,110 @@
 Tests for the lexer module
 """
 
+import sys
 import pytest
 from ethicalang.lexer.lexer import Lexer, TokenType
 
 
+# Single-line sources and the tokens expected at given positions, as
+# (index, type, value); a value of None means the value isn't checked
+TOKEN_CASES = [
+    pytest.param("123 + 456", [
+        (0, TokenType.INTEGER, 123),
+        (1, TokenType.PLUS, None),
+        (2, TokenType.INTEGER, 456),
+    ], id="simple_tokens"),
+    pytest.param('"hello world"', [
+        (0, TokenType.STRING, "hello world"),
+    ], id="string_literals"),
+    pytest.param("function if else while for return", [
+        (0, TokenType.FUNCTION, None),
+        (1, TokenType.IF, None),
+        (2, TokenType.ELSE, None),
+        (3, TokenType.WHILE, None),
+        (4, TokenType.FOR, None),
+        (5, TokenType.RETURN, None),
+    ], id="keywords"),
+    pytest.param("functio fn els iff whiles fore returned", [
+        (0, TokenType.IDENTIFIER, "functio"),
+        (1, TokenType.IDENTIFIER, "fn"),
+        (2, TokenType.IDENTIFIER, "els"),
+        (3, TokenType.IDENTIFIER, "iff"),
+        (4, TokenType.IDENTIFIER, "whiles"),
+        (5, TokenType.IDENTIFIER, "fore"),
+        (6, TokenType.IDENTIFIER, "returned"),
+    ], id="keyword_near_misses"),
+    pytest.param("variable_name another_var x", [
+        (0, TokenType.IDENTIFIER, "variable_name"),
+        (1, TokenType.IDENTIFIER, "another_var"),
+        (2, TokenType.IDENTIFIER, "x"),
+    ], id="identifiers"),
+    pytest.param("+ - * / == != < > <= >=", [
+        (0, TokenType.PLUS, None),
+        (1, TokenType.MINUS, None),
+        (2, TokenType.MULTIPLY, None),
+        (3, TokenType.DIVIDE, None),
+        (4, TokenType.EQ, None),
+        (5, TokenType.NE, None),
+        (6, TokenType.LT, None),
+        (7, TokenType.GT, None),
+        (8, TokenType.LE, None),
+        (9, TokenType.GE, None),
+    ], id="operators"),
+    pytest.param("@decorator", [
+        (0, TokenType.AT, None),
+        (1, TokenType.IDENTIFIER, "decorator"),
+    ], id="annotation_symbol"),
+]
+
+
 class TestLexer:
     """Test cases for the lexer"""
     
-    def test_simple_tokens(self):
-        """Test basic token recognition"""
-        source = "123 + 456"
+    @pytest.mark.parametrize("source,expected", TOKEN_CASES)
+    def test_tokens(self, source, expected):
+        """Test token recognition for single-line sources"""
         lexer = Lexer(source)
         tokens = lexer.tokenize()
         
-        assert tokens[0].type == TokenType.INTEGER
-        assert tokens[0].value == 123
-        assert tokens[1].type == TokenType.PLUS
-        assert tokens[2].type == TokenType.INTEGER
-        assert tokens[2].value == 456
+        for index, token_type, value in expected:
+            assert tokens[index].type == token_type
+            if value is not None:
+                assert tokens[index].value == value
     
-    def test_string_literals(self):
-        """Test string literal tokenization"""
-        source = '"hello world"'
-        lexer = Lexer(source)
+    @pytest.mark.parametrize("text,token_type", [
+        ("+", TokenType.PLUS), ("-", TokenType.MINUS), ("*", TokenType.MULTIPLY),
+        ("/", TokenType.DIVIDE), ("%", TokenType.MODULO), ("=", TokenType.ASSIGN),
+        ("<", TokenType.LT), (">", TokenType.GT), ("(", TokenType.LPAREN),
+        (")", TokenType.RPAREN), ("[", TokenType.LBRACKET), ("]", TokenType.RBRACKET),
+        ("{", TokenType.LBRACE), ("}", TokenType.RBRACE), (",", TokenType.COMMA),
+        (":", TokenType.COLON), ("@", TokenType.AT),
+        ("->", TokenType.ARROW), ("**", TokenType.POWER), ("==", TokenType.EQ),
+        ("!=", TokenType.NE), ("<=", TokenType.LE), (">=", TokenType.GE),
+    ])
+    def test_operator_token(self, text, token_type):
+        """Test each operator and punctuation token on its own"""
+        lexer = Lexer(text)
         tokens = lexer.tokenize()
         
-        assert tokens[0].type == TokenType.STRING
-        assert tokens[0].value == "hello world"
+        assert [token.type for token in tokens] == [token_type, TokenType.EOF]
+        assert tokens[0].value == text
     
-    def test_keywords(self):
-        """Test keyword recognition"""
-        source = "function if else while for return"
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
+    def test_non_decimal_digit_is_lexer_error(self):
+        """Test that a digit-like character such as '²' is a lexer error"""
+        lexer = Lexer("x = ²")
         
-        assert tokens[0].type == TokenType.FUNCTION
-        assert tokens[2].type == TokenType.IF
-        assert tokens[4].type == TokenType.ELSE
-        assert tokens[6].type == TokenType.WHILE
-        assert tokens[8].type == TokenType.FOR
-        assert tokens[10].type == TokenType.RETURN
+        with pytest.raises(SyntaxError):
+            lexer.tokenize()
     
-    def test_identifiers(self):
-        """Test identifier tokenization"""
-        source = "variable_name another_var x"
+    def test_identifiers_are_interned(self):
+        """Test that identifier values are interned strings"""
+        source = "variable_name = variable_name"
         lexer = Lexer(source)
         tokens = lexer.tokenize()
         
-        assert tokens[0].type == TokenType.IDENTIFIER
-        assert tokens[0].value == "variable_name"
-        assert tokens[2].type == TokenType.IDENTIFIER
-        assert tokens[2].value == "another_var"
-    
-    def test_operators(self):
-        """Test operator tokenization"""
-        source = "+ - * / == != < > <= >="
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        assert tokens[0].type == TokenType.PLUS
-        assert tokens[2].type == TokenType.MINUS
-        assert tokens[4].type == TokenType.MULTIPLY
-        assert tokens[6].type == TokenType.DIVIDE
-        assert tokens[8].type == TokenType.EQ
-        assert tokens[10].type == TokenType.NE
+        assert tokens[0].value is sys.intern("variable_name")
+        assert tokens[2].value is tokens[0].value
     
     def test_indentation(self):
         """Test indentation handling"""
@@ -76,12 +116,14 @@ class TestLexer:
         lexer = Lexer(source)
         tokens = lexer.tokenize()
         
-        # Should have INDENT and DEDENT tokens
-        indent_tokens = [t for t in tokens if t.type == TokenType.INDENT]
-        dedent_tokens = [t for t in tokens if t.type == TokenType.DEDENT]
+        # Should have INDENT and DEDENT tokens, counted in one pass
+        indents = dedents = 0
+        for token in tokens:
+            indents += token.type == TokenType.INDENT
+            dedents += token.type == TokenType.DEDENT
         
-        assert len(indent_tokens) == 1
-        assert len(dedent_tokens) == 1
+        assert indents == 1
+        assert dedents == 1
     
     def test_comments(self):
         """Test comment handling"""
@@ -95,13 +137,3 @@ x = 5  # Inline comment
         identifiers = [t for t in tokens if t.type == TokenType.IDENTIFIER]
         assert len(identifiers) == 1
         assert identifiers[0].value == "x"
-    
-    def test_annotation_symbol(self):
-        """Test @ symbol for annotations"""
-        source = "@decorator"
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        assert tokens[0].type == TokenType.AT
-        assert tokens[1].type == TokenType.IDENTIFIER
-        assert tokens[1].value == "decorator"
@@ -2,21 +2,31 @@
 Tests for the parser module
 """
 
+import functools
 import pytest
 from ethicalang.lexer.lexer import Lexer
 from ethicalang.parser.parser import Parser
 from ethicalang.ast.nodes import *
 
 
+# Bounded so the cached trees don't accumulate over the session. Tests don't
+# modify the nodes; a walk only fills Program's derived _events/_walks
+# caches, which come out the same whichever test fills them first.
+@functools.lru_cache(maxsize=16)
+def _parse(source):
+    """Lex and parse source, reusing the tree for repeated sources"""
+    lexer = Lexer(source)
+    tokens = lexer.tokenize()
+    parser = Parser(tokens)
+    return parser.parse()
+
+
 class TestParser:
     """Test cases for the parser"""
     
     def parse(self, source):
         """Helper to parse source code"""
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        parser = Parser(tokens)
-        return parser.parse()
+        return _parse(source)
     
     def test_simple_assignment(self):
         """Test simple variable assignment"""
@@ -108,6 +118,26 @@ else:
         assert isinstance(assignment.value, DictLiteral)
         assert len(assignment.value.pairs) == 2
     
+    def test_literal_kinds(self):
+        """Test that literals are parsed into their specialized node classes"""
+        source = 'values = [1, 2.5, "text", true, none]'
+        ast = self.parse(source)
+        
+        elements = ast.statements[0].value.elements
+        assert [type(elem) for elem in elements] == [
+            NumericLiteral, NumericLiteral, StringLiteral, BoolLiteral, Literal
+        ]
+        assert all(isinstance(elem, Literal) for elem in elements)
+    
+    def test_repeated_literals_share_node(self):
+        """Test that repeated constants are parsed into one shared node"""
+        source = 'values = [1, 1, 1.0, true, "1"]'
+        ast = self.parse(source)
+        
+        elements = ast.statements[0].value.elements
+        assert elements[0] is elements[1]
+        assert len({id(elem) for elem in elements}) == 4
+    
     def test_annotation(self):
         """Test annotation parsing"""
         source = """@requires_user_consent
@@ -132,3 +162,45 @@ function collect_data():
         assert assignment.value.operator == "+"
         assert isinstance(assignment.value.right, BinaryOp)
         assert assignment.value.right.operator == "*"
+    
+    @pytest.mark.parametrize("expression,expected", [
+        ("a + b * c - d / e == f",
+         "BinaryOp(BinaryOp(BinaryOp(Var(a) + BinaryOp(Var(b) * Var(c))) - "
+         "BinaryOp(Var(d) / Var(e))) == Var(f))"),
+        ("(a + b) * c", "BinaryOp(BinaryOp(Var(a) + Var(b)) * Var(c))"),
+        ("a < b and c > d or e",
+         "BinaryOp(BinaryOp(BinaryOp(Var(a) < Var(b)) and BinaryOp(Var(c) > Var(d))) or Var(e))"),
+        ("a % b + c <= d != e",
+         "BinaryOp(BinaryOp(BinaryOp(BinaryOp(Var(a) % Var(b)) + Var(c)) <= Var(d)) != Var(e))"),
+        ("a ** b ** c", "BinaryOp(Var(a) ** BinaryOp(Var(b) ** Var(c)))"),
+        ("-a * b", "BinaryOp(UnaryOp(- Var(a)) * Var(b))"),
+    ])
+    def test_operator_precedence(self, expression, expected):
+        """Test the tree shape across the precedence table"""
+        ast = self.parse(f"result = {expression}")
+        
+        assert repr(ast.statements[0].value) == expected
+    
+    def test_left_associative_operators(self):
+        """Test that same-precedence operators group to the left"""
+        source = "result = a - b - c or d"
+        ast = self.parse(source)
+        
+        expr = ast.statements[0].value
+        assert expr.operator == "or"
+        assert expr.left.operator == "-"
+        assert expr.left.left.operator == "-"
+        assert expr.left.left.left.name == "a"
+    
+    def test_large_program(self):
+        """Test parsing a long program of repeated statements"""
+        source = "\n".join(f"x{i} = a + b * c" for i in range(10000))
+        # Parsed directly rather than through the cache, so the tree is
+        # released once the test ends
+        ast = Parser(Lexer(source).tokenize()).parse()
+        
+        assert len(ast.statements) == 10000
+        last = ast.statements[-1]
+        assert last.name == "x9999"
+        assert last.value.operator == "+"
+        assert last.value.right.operator == "*"
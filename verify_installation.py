@@ -4,19 +4,21 @@ Verification script for EthicaLang installation
 Runs a quick check to ensure everything is working
 """
 
+import os
 import sys
 from pathlib import Path
 
+# Colored check statuses, formatted once
+_PASS = "\033[92m✓ PASS\033[0m"
+_FAIL = "\033[91m✗ FAIL\033[0m"
+
 def print_header(text):
     print("\n" + "=" * 60)
     print(f"  {text}")
     print("=" * 60)
 
 def print_check(name, passed):
-    status = "✓ PASS" if passed else "✗ FAIL"
-    color = "\033[92m" if passed else "\033[91m"
-    reset = "\033[0m"
-    print(f"{color}{status}{reset} - {name}")
+    print(f"{_PASS if passed else _FAIL} - {name}")
 
 def main():
     print_header("EthicaLang Installation Verification")
@@ -26,9 +28,12 @@ def main():
     # Check 1: Python version
     print("\nChecking Python version...")
     py_version = sys.version_info
-    py_ok = py_version.major == 3 and py_version.minor >= 8
+    py_ok = py_version.major == 3 and py_version.minor >= 9
     print_check(f"Python {py_version.major}.{py_version.minor}.{py_version.micro}", py_ok)
-    all_passed = all_passed and py_ok
+    if not py_ok:
+        # Nothing after this can work on an unsupported interpreter
+        print("\n⚠ Python 3.9+ required")
+        return 1
     
     # Check 2: Import modules
     print("\nChecking module imports...")
@@ -39,7 +44,9 @@ def main():
         from ethicalang.parser import Parser
         print_check("Parser module", True)
         
-        from ethicalang.analysis import EnergyAnalyzer, EthicsChecker, ReadabilityScorer, ClevernessDetector
+        from ethicalang.analysis import (
+            EnergyAnalyzer, EthicsChecker, ReadabilityScorer, ClevernessDetector, CombinedAnalyzer
+        )
         print_check("Analysis modules", True)
         
         from ethicalang.runtime import Interpreter
@@ -50,7 +57,6 @@ def main():
         
     except ImportError as e:
         print_check(f"Module import: {e}", False)
-        all_passed = False
         print("\n⚠ Run: pip install -e .")
         return 1
     
@@ -67,30 +73,42 @@ result = test()
         lexer = Lexer(source)
         tokens = lexer.tokenize()
         print_check("Lexer", len(tokens) > 0)
+        if not tokens:
+            return 1
         
         parser = Parser(tokens)
         ast = parser.parse()
         print_check("Parser", ast is not None)
+        if ast is None:
+            return 1
         
-        energy = EnergyAnalyzer()
-        energy_result = energy.analyze(ast)
-        print_check("Energy Analyzer", energy_result is not None)
-        
-        ethics = EthicsChecker(strict_mode=False)
-        ethics_result = ethics.analyze(ast)
-        print_check("Ethics Checker", ethics_result is not None)
-        
-        readability = ReadabilityScorer()
-        readability_result = readability.analyze(ast)
-        print_check("Readability Scorer", readability_result is not None)
-        
-        cleverness = ClevernessDetector(strict_mode=False)
-        cleverness_result = cleverness.analyze(ast)
-        print_check("Cleverness Detector", cleverness_result is not None)
+        # All four analyzers share one walk of the sample, as in `check`
+        analyzers = {
+            'energy': EnergyAnalyzer(),
+            'ethics': EthicsChecker(strict_mode=False),
+            'readability': ReadabilityScorer(),
+            'cleverness': ClevernessDetector(strict_mode=False),
+        }
+        combined = CombinedAnalyzer(analyzers)
+        results = combined.analyze(ast)
+        labels = {
+            'energy': "Energy Analyzer",
+            'ethics': "Ethics Checker",
+            'readability': "Readability Scorer",
+            'cleverness': "Cleverness Detector",
+        }
+        # A failing analyzer has no result; its exception is in errors
+        for name, label in labels.items():
+            if name in combined.errors:
+                print_check(f"{label}: {combined.errors[name]}", False)
+            else:
+                print_check(label, results.get(name) is not None)
         
     except Exception as e:
         print_check(f"Compilation: {e}", False)
-        all_passed = False
+        return 1
+    
+    if combined.errors:
         return 1
     
     # Check 4: Execution test
@@ -99,18 +117,21 @@ result = test()
         interpreter = Interpreter()
         result = interpreter.execute(ast)
         print_check("Interpreter execution", result == 1)
+        if result != 1:
+            return 1
     except Exception as e:
         print_check(f"Execution: {e}", False)
-        all_passed = False
         return 1
     
     # Check 5: Example files exist
     print("\nChecking example files...")
     examples_dir = Path(__file__).parent / "examples"
-    if examples_dir.exists():
-        example_files = list(examples_dir.glob("*.eth"))
-        print_check(f"Found {len(example_files)} example files", len(example_files) > 0)
-    else:
+    try:
+        # Only the count is needed, so scan names without building Paths
+        with os.scandir(examples_dir) as entries:
+            example_count = sum(1 for entry in entries if entry.name.endswith(".eth"))
+        print_check(f"Found {example_count} example files", example_count > 0)
+    except FileNotFoundError:
         print_check("Examples directory", False)
         all_passed = False
     